@@ -1,4 +1,5 @@
 import sys
+import multiprocessing
 import os
 from pathlib import Path
 from typing import Optional
@@ -313,4 +314,5 @@ def main() -> int:
         return 1
         
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     sys.exit(main())
\ No newline at end of file
@@ -15,11 +15,14 @@ setup(
     install_requires=[
         "openpyxl>=3.0.0",
         "pandas>=1.0.0",
+        "numpy",
         "psutil",
+        "lxml",
         "pywin32;platform_system=='Windows'",  # Essential for Windows operation
     ],
     extras_require={
         "dev": ["pytest", "black", "flake8"],
+        "speed": ["numba", "xlsxwriter"],
     },
     entry_points={
         "console_scripts": [
@@ -9,12 +9,22 @@ import os
 import time
 import logging
 import gc
+import ctypes
 import shutil
+import signal
+import subprocess
 import tempfile
+import threading
 import uuid
+import zipfile
+import zlib
+from copy import copy
 from pathlib import Path
 from typing import Dict, Tuple, Optional, Any, List, Union
 from queue import Queue
+from multiprocessing import get_context, parent_process
+from itertools import islice
+from xml.etree.ElementTree import iterparse
 
 # Import from the modules package to avoid circular imports
 try:
@@ -25,14 +35,21 @@ except ImportError:
 # Try to import Excel-related modules - they might be unavailable on some platforms
 try:
     import openpyxl
-    from openpyxl.styles import PatternFill, Font, Border, Side, Alignment, Color
+    from openpyxl.styles import PatternFill, Font, Border, Side, Alignment, Color, NamedStyle
     from openpyxl.styles.colors import COLOR_INDEX
-    from openpyxl.cell import MergedCell
+    from openpyxl.styles.fonts import DEFAULT_FONT
+    from openpyxl.cell import Cell, WriteOnlyCell
+    from openpyxl.cell.cell import TIME_FORMATS
+    from openpyxl.cell.read_only import EMPTY_CELL
     from openpyxl.utils import get_column_letter
     from openpyxl.utils.exceptions import InvalidFileException
+    from openpyxl.utils.units import DEFAULT_COLUMN_WIDTH
+    from openpyxl.xml import LXML as LXML_AVAILABLE
+    from openpyxl.xml.constants import SHEET_MAIN_NS
     OPENPYXL_AVAILABLE = True
 except ImportError:
     OPENPYXL_AVAILABLE = False
+    LXML_AVAILABLE = False
 
 try:
     import pandas as pd
@@ -40,6 +57,24 @@ try:
 except ImportError:
     PANDAS_AVAILABLE = False
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Import Windows-specific modules - these are essential for the application
 import sys
 
@@ -67,12 +102,709 @@ DEFAULT_HEADER_ROW = 5
 DEFAULT_HEADERS_TO_FIND = ["Difference", "Include in CFO Cert Letter", "Explanation"]
 DEFAULT_OUTPUT_DIR = "output"
 
+# Smallest size a workbook written by this processor can have
+MIN_XLSX_SIZE = 512
+
+# DO Comments classification codes and the comment text for each code
+COMMENT_NONE = 0
+COMMENT_REASONABLE = 1
+COMMENT_INCLUDE_CFO = 2
+COMMENT_REQUIRED = 3
+DO_COMMENT_TEXT = (
+    None,
+    "Explanation Reasonable",
+    "Explanation Reasonable; Include in CFO Cert Letter",
+    "Explanation Required",
+)
+
+_DO_COMMENT_TEXT_ARRAY = np.array(DO_COMMENT_TEXT, dtype=object) if NUMPY_AVAILABLE else None
+
+# Named styles registered on the output workbook for DO Comments cells
+COMMENT_STYLE_WRAP = "sf132_wrap"
+COMMENT_STYLE_REQUIRED = "sf132_required"
+
+# openpyxl 3.x keeps worksheet cells in a (row, column) -> Cell dict that
+# the DO Comments column can be inserted into directly
+DIRECT_CELL_STORE = OPENPYXL_AVAILABLE and int(openpyxl.__version__.split(".")[0]) >= 3
+
+# Rows read and classified per chunk, bounding the raw values held at once
+CLASSIFY_CHUNK_ROWS = 50_000
+
+# Rows held back while a sheet is streamed, waiting for their DO Comments to be classified
+STREAM_CLASSIFY_ROWS = 10_000
+
+# Rows copied between progress updates while streaming a sheet
+COPY_PROGRESS_EVERY = 1000
+
+# Progress updates closer together than this many seconds and percentage points are dropped
+PROGRESS_MIN_INTERVAL = 0.05
+PROGRESS_MIN_STEP = 2
+
+# Errors that fail the same way on every attempt, so process_file does not retry them
+_NON_RETRYABLE_ERRORS = (FileNotFoundError, IsADirectoryError, KeyError) + (
+    (InvalidFileException,) if OPENPYXL_AVAILABLE else ()
+)
+
+# Environment variable naming a directory (e.g. a RAM disk) for per-file temp directories
+TEMP_DIR_ENV_VAR = "SF132_TMPDIR"
+
+# Seconds an Excel process scan is reused by close_excel_instances
+EXCEL_SCAN_CACHE_SECONDS = 0.5
+
+# First wait, in seconds, between checks for a locked file; it doubles on each retry
+FILE_ACCESS_RETRY_DELAY = 0.2
+
+# Access right needed to kill a process with TerminateProcess
+PROCESS_TERMINATE = 0x0001
+
+# Linux ioctl that makes a file share another file's extents (Btrfs, XFS)
+FICLONE = 0x40049409
+
+# Command-line markers for Excel processes whose name could not be read
+_EXCEL_CMDLINE_MARKERS = ('EXCEL.EXE', 'EXCELCNV')
+
+# Office install directories searched for the excelcnv.exe converter
+_OFFICE_DIRS = (
+    r"C:\Program Files\Microsoft Office\root\Office16",
+    r"C:\Program Files (x86)\Microsoft Office\root\Office16",
+    r"C:\Program Files\Microsoft Office\Office16",
+    r"C:\Program Files (x86)\Microsoft Office\Office16",
+    r"C:\Program Files\Microsoft Office\Office15",
+    r"C:\Program Files (x86)\Microsoft Office\Office15",
+)
+
+# openpyxl border styles and their xlsxwriter border index
+XLSXWRITER_BORDERS = {
+    'thin': 1, 'medium': 2, 'dashed': 3, 'dotted': 4, 'thick': 5, 'double': 6, 'hair': 7,
+    'mediumDashed': 8, 'dashDot': 9, 'mediumDashDot': 10, 'dashDotDot': 11,
+    'mediumDashDotDot': 12, 'slantDashDot': 13,
+}
+XLSXWRITER_VALIGN = {
+    'top': 'top', 'center': 'vcenter', 'bottom': 'bottom',
+    'justify': 'vjustify', 'distributed': 'vdistributed',
+}
+
+# Shared style objects - openpyxl compares styles by value, so one instance serves every cell
+if OPENPYXL_AVAILABLE:
+    _WRAP_ALIGN = Alignment(wrap_text=True, vertical='center')
+    _THIN_BORDER = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    _RED_FILL = PatternFill(start_color="FFCCCC", end_color="FFCCCC", fill_type="solid")
+
+# CFO flag codes used to index the classification lookup table
+CFO_NO = 0
+CFO_YES = 1
+CFO_OTHER = 2
+
+# Membership sets used by the classifiers - built once instead of per row
+_BLANK_VALUES = frozenset((None, ""))
+_EMPTY_EXPLANATIONS = frozenset((None, "", 0))
+_CFO_NO_VALUES = frozenset(("N", "NO"))
+_CFO_YES_VALUES = frozenset(("Y", "YES"))
+
+# Fill colours that are not copied because they render as solid black
+_BLACK_FILL_RGBS = frozenset(("", "00000000", "FF000000", "000000"))
+
+# Sheets with more rows than this are classified across a process pool
+PARALLEL_CLASSIFY_ROW_THRESHOLD = 20_000
+
+
+def _build_comment_lut():
+    """
+    Build the DO Comments lookup table.
+    
+    The table is indexed by [cfo_code, has_explanation, difference_is_zero]
+    and holds the comment code for that combination, replacing the per-row
+    if/elif chain with a single gather.
+    
+    Returns:
+        np.ndarray: 3x2x2 int8 array of comment codes
+    """
+    lut = np.full((3, 2, 2), COMMENT_NONE, dtype=np.int8)
+    lut[:, 0, 0] = COMMENT_REQUIRED
+    lut[CFO_NO, 1, 0] = COMMENT_REASONABLE
+    lut[CFO_YES, 1, 0] = COMMENT_INCLUDE_CFO
+    return lut
+
+
+_COMMENT_LUT = _build_comment_lut() if NUMPY_AVAILABLE else None
+
+
+def _classify_codes_kernel(cfo_codes, has_explanation, diff_zero, out_codes) -> None:
+    """
+    Fill comment codes from the encoded classifier inputs.
+    
+    Written as a plain loop so Numba can compile it; the branches match
+    _classify_do_comment.
+    
+    Args:
+        cfo_codes: CFO_* code per row
+        has_explanation: True where the Explanation cell is filled in
+        diff_zero: True where the Difference is blank or zero
+        out_codes: int8 output array receiving a COMMENT_* code per row
+    """
+    for i in range(out_codes.shape[0]):
+        if diff_zero[i]:
+            out_codes[i] = COMMENT_NONE
+        elif not has_explanation[i]:
+            out_codes[i] = COMMENT_REQUIRED
+        elif cfo_codes[i] == CFO_NO:
+            out_codes[i] = COMMENT_REASONABLE
+        elif cfo_codes[i] == CFO_YES:
+            out_codes[i] = COMMENT_INCLUDE_CFO
+        else:
+            out_codes[i] = COMMENT_NONE
+
+
+_classify_codes_jit = njit(cache=True)(_classify_codes_kernel) if NUMBA_AVAILABLE else None
+
+
+def _coerce_difference(value) -> float:
+    """
+    Convert a Difference cell value to a float, treating blanks and
+    non-numeric values as zero.
+    
+    Args:
+        value: Raw cell value
+        
+    Returns:
+        float: Numeric difference
+    """
+    # Numeric cells, the common case, need neither the blank check nor an exception handler
+    if isinstance(value, (int, float)):
+        return float(value) if value == value else 0
+    if value in _BLANK_VALUES:
+        return 0
+    try:
+        number = float(value)
+    except (ValueError, TypeError):
+        return 0
+    # NaN never matches the blank set, so treat it as non-numeric explicitly
+    return number if number == number else 0
+
+
+def _classify_do_comment(difference_value, include_cfo_value, explanation_value) -> int:
+    """
+    Classify a single row for the DO Comments column.
+    
+    Args:
+        difference_value: Raw value of the Difference cell
+        include_cfo_value: Raw value of the Include in CFO Cert Letter cell
+        explanation_value: Raw value of the Explanation cell
+        
+    Returns:
+        int: One of the COMMENT_* codes
+    """
+    if _coerce_difference(difference_value) == 0:
+        return COMMENT_NONE
+    
+    # Every remaining branch depends on the explanation, so test it once up front
+    if explanation_value in _EMPTY_EXPLANATIONS:
+        return COMMENT_REQUIRED
+    
+    include_cfo_value = str(include_cfo_value).upper() if include_cfo_value is not None else ""
+    if include_cfo_value in _CFO_NO_VALUES:
+        return COMMENT_REASONABLE
+    elif include_cfo_value in _CFO_YES_VALUES:
+        return COMMENT_INCLUDE_CFO
+    return COMMENT_NONE
+
+
+def _object_array(values):
+    """
+    Copy column values into a 1-D object array.
+    
+    Args:
+        values: Column values
+        
+    Returns:
+        np.ndarray: Object array holding the values unchanged
+    """
+    array = np.empty(len(values), dtype=object)
+    array[:] = list(values)
+    return array
+
+
+def _is_empty(values, empty_values):
+    """
+    Build a mask of the cells holding one of the given empty values.
+    
+    The comparisons run element-wise inside NumPy rather than as a Python
+    membership test per row, and match ``value in empty_values``.
+    
+    Args:
+        values: Object array of column values
+        empty_values: Values that count as empty
+        
+    Returns:
+        np.ndarray: Boolean mask, True where the value is empty
+    """
+    mask = np.zeros(len(values), dtype=bool)
+    for empty_value in empty_values:
+        if empty_value is None:
+            mask |= np.equal(values, None)
+        else:
+            mask |= values == empty_value
+    return mask
+
+
+def _coerce_differences(differences):
+    """
+    Convert the Difference column to floats in one pass.
+    
+    Blank cells become zero. Values that cannot be read as numbers are also
+    treated as zero and reported back so the caller can summarise them.
+    
+    Args:
+        differences: Difference column values
+        
+    Returns:
+        tuple: (float array of differences, array of invalid row offsets)
+    """
+    count = len(differences)
+    differences = _object_array(differences)
+    blank = _is_empty(differences, _BLANK_VALUES)
+    
+    if PANDAS_AVAILABLE:
+        numeric = pd.to_numeric(pd.Series(differences, dtype=object), errors="coerce").to_numpy(dtype=np.float64)
+    else:
+        numeric = np.fromiter(
+            (_coerce_difference(value) if _is_number_like(value) else np.nan for value in differences),
+            dtype=np.float64, count=count
+        )
+    
+    invalid = np.isnan(numeric) & ~blank
+    return np.where(blank | invalid, 0.0, numeric), np.flatnonzero(invalid)
+
+
+def _is_number_like(value) -> bool:
+    """
+    Check whether a cell value can be read as a number.
+    
+    Args:
+        value: Raw cell value
+        
+    Returns:
+        bool: True if float() accepts the value and it is not NaN
+    """
+    if isinstance(value, (int, float)):
+        return value == value
+    try:
+        number = float(value)
+    except (ValueError, TypeError):
+        return False
+    return number == number
+
+
+def _classify_do_comments(differences, include_cfo_values, explanations):
+    """
+    Classify rows for the DO Comments column.
+    
+    Uses the compiled Numba kernel or the NumPy lookup table when available
+    and falls back to the per-row classifier otherwise. Malformed values never raise; rows whose
+    Difference is not numeric are returned as invalid instead.
+    
+    Args:
+        differences: Difference column values
+        include_cfo_values: Include in CFO Cert Letter column values
+        explanations: Explanation column values
+        
+    Returns:
+        tuple: (COMMENT_* code per row, offsets of rows with invalid differences)
+    """
+    if not NUMPY_AVAILABLE:
+        codes = []
+        invalid_rows = []
+        for offset, (diff, cfo, expl) in enumerate(zip(differences, include_cfo_values, explanations)):
+            # Invalid differences count as zero, so they never need classifying
+            if diff not in _BLANK_VALUES and not _is_number_like(diff):
+                invalid_rows.append(offset)
+                codes.append(COMMENT_NONE)
+            else:
+                codes.append(_classify_do_comment(diff, cfo, expl))
+        return codes, invalid_rows
+    
+    count = len(differences)
+    numeric_differences, invalid_rows = _coerce_differences(differences)
+    
+    # Only rows with a non-zero difference can get a comment, so classify just those
+    codes = np.full(count, COMMENT_NONE, dtype=np.int8)
+    active = np.flatnonzero(numeric_differences != 0)
+    if not active.size:
+        return codes, invalid_rows
+    
+    diff_zero = np.zeros(active.size, dtype=bool)
+    has_explanation = ~_is_empty(_object_array(explanations)[active], _EMPTY_EXPLANATIONS)
+    
+    # Homogenise the flag column to upper-case strings; None becomes "NONE", which is neither Y nor N
+    cfo = np.char.upper(_object_array(include_cfo_values)[active].astype(str))
+    
+    # Most reports use one CFO flag for the whole sheet; classify those with a 2x2 table
+    if (cfo == cfo[0]).all():
+        codes[active] = _classify_uniform_cfo(_cfo_code(cfo[0]), has_explanation, diff_zero)
+        return codes, invalid_rows
+    
+    cfo_idx = np.where(
+        np.isin(cfo, tuple(_CFO_NO_VALUES)),
+        CFO_NO,
+        np.where(np.isin(cfo, tuple(_CFO_YES_VALUES)), CFO_YES, CFO_OTHER)
+    )
+    
+    if NUMBA_AVAILABLE:
+        active_codes = np.empty(active.size, dtype=np.int8)
+        _classify_codes_jit(cfo_idx.astype(np.int8), has_explanation, diff_zero, active_codes)
+    else:
+        active_codes = _COMMENT_LUT[cfo_idx, has_explanation.astype(np.int8), diff_zero.astype(np.int8)]
+    codes[active] = active_codes
+    return codes, invalid_rows
+
+
+def _cfo_code(include_cfo_value: str) -> int:
+    """
+    Encode an upper-cased Include in CFO Cert Letter value.
+    
+    Args:
+        include_cfo_value: Upper-cased flag value
+        
+    Returns:
+        int: One of the CFO_* codes
+    """
+    if include_cfo_value in _CFO_NO_VALUES:
+        return CFO_NO
+    if include_cfo_value in _CFO_YES_VALUES:
+        return CFO_YES
+    return CFO_OTHER
+
+
+def _classify_uniform_cfo(cfo_code: int, has_explanation, diff_zero):
+    """
+    Classify rows that all share the same CFO flag.
+    
+    With the flag fixed, the lookup table reduces to a 2x2 slice indexed
+    by [has_explanation, difference_is_zero].
+    
+    Args:
+        cfo_code: CFO_* code shared by every row
+        has_explanation: True where the Explanation cell is filled in
+        diff_zero: True where the Difference is blank or zero
+        
+    Returns:
+        np.ndarray: int8 COMMENT_* code per row
+    """
+    return _COMMENT_LUT[cfo_code][has_explanation.astype(np.int8), diff_zero.astype(np.int8)]
+
+
+def _comment_texts(comment_codes) -> List[Optional[str]]:
+    """
+    Map comment codes to the DO Comments text in one gather.
+    
+    Args:
+        comment_codes: COMMENT_* code per row
+        
+    Returns:
+        List[Optional[str]]: Comment text per row
+    """
+    if NUMPY_AVAILABLE:
+        return _DO_COMMENT_TEXT_ARRAY[np.asarray(comment_codes, dtype=np.intp)].tolist()
+    return [DO_COMMENT_TEXT[comment_code] for comment_code in comment_codes]
+
+
+def _contiguous_runs(offsets) -> List[Tuple[int, int]]:
+    """
+    Group sorted row offsets into runs of consecutive offsets.
+    
+    Args:
+        offsets: Sorted row offsets
+        
+    Returns:
+        List[Tuple[int, int]]: Inclusive (first, last) offset of each run
+    """
+    if not len(offsets):
+        return []
+    
+    if NUMPY_AVAILABLE:
+        offsets = np.asarray(offsets)
+        breaks = np.diff(offsets) != 1
+        starts = offsets[np.concatenate(([True], breaks))]
+        ends = offsets[np.concatenate((breaks, [True]))]
+        return list(zip(starts.tolist(), ends.tolist()))
+    
+    runs = []
+    start = previous = offsets[0]
+    for offset in offsets[1:]:
+        if offset != previous + 1:
+            runs.append((start, previous))
+            start = offset
+        previous = offset
+    runs.append((start, previous))
+    return runs
+
+
+def _iter_column_chunks(sheet, first_row: int, last_row: int, columns, chunk_rows: int = CLASSIFY_CHUNK_ROWS):
+    """
+    Read selected columns from a worksheet in chunks of rows.
+    
+    Regular worksheets are read from their cell store without creating
+    cells for blanks; read-only worksheets are streamed with iter_rows.
+    
+    Args:
+        sheet: Worksheet to read
+        first_row: First row to read
+        last_row: Last row to read (inclusive)
+        columns: Column numbers to return
+        chunk_rows: Number of rows per chunk
+        
+    Yields:
+        tuple: One list of values per requested column, covering the chunk's rows
+    """
+    cells = getattr(sheet, '_cells', None) if DIRECT_CELL_STORE else None
+    if cells is not None:
+        # Look cells up in the cell store so blank cells are never created
+        get = cells.get
+        for low in range(first_row, last_row + 1, chunk_rows):
+            chunk = range(low, min(low + chunk_rows - 1, last_row) + 1)
+            yield tuple([getattr(get((row, column)), 'value', None) for row in chunk] for column in columns)
+        return
+    
+    min_col, max_col = min(columns), max(columns)
+    offsets = [column - min_col for column in columns]
+    width = max_col - min_col + 1
+    
+    # One iterator over the whole range - read-only sheets reparse from the top on every iter_rows call
+    rows = sheet.iter_rows(min_row=first_row, max_row=last_row, min_col=min_col, max_col=max_col, values_only=True)
+    for low in range(first_row, last_row + 1, chunk_rows):
+        high = min(low + chunk_rows - 1, last_row)
+        values = list(islice(rows, high - low + 1))
+        
+        # Read-only sheets stop at the last stored row and may return short rows
+        values.extend([()] * (high - low + 1 - len(values)))
+        values = [row if len(row) == width else tuple(row) + (None,) * (width - len(row)) for row in values]
+        
+        yield tuple([row[offset] for row in values] for offset in offsets)
+
+
+def _style_key(cell):
+    """
+    Identify a source cell's style so it can be translated once per style.
+    
+    Args:
+        cell: Source cell (regular or read-only)
+        
+    Returns:
+        Hashable key shared by cells with the same style
+    """
+    style_id = getattr(cell, '_style_id', None)
+    if style_id is not None:
+        return style_id
+    if cell._style is None:
+        return 0
+    return tuple(cell._style)
+
+
+def _xlsxwriter_width(width: float) -> float:
+    """
+    Convert a stored column width to the width xlsxwriter must be given to store it.
+    
+    xlsxwriter adds Calibri 11 cell padding (5 pixels, about 0.71 characters)
+    to the widths it is given, while openpyxl stores them as they are.
+    
+    Args:
+        width: Column width as stored in the file, in characters
+        
+    Returns:
+        Width to pass to set_column so the same pixel width is stored
+    """
+    pixels = round(width * 7)
+    if pixels < 12:
+        return pixels / 12
+    return (pixels - 5) / 7
+
+
+def _file_size(path: str) -> int:
+    """
+    Get a file's size with a single stat call.
+    
+    Args:
+        path: File path
+        
+    Returns:
+        Size in bytes, or 0 if the file is missing or cannot be read
+    """
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+def _find_excelcnv() -> Optional[str]:
+    """
+    Locate Office's excelcnv.exe command-line converter.
+    
+    Returns:
+        Path to excelcnv.exe, or None if Office is not installed in a known place
+    """
+    for office_dir in _OFFICE_DIRS:
+        excelcnv_path = os.path.join(office_dir, "excelcnv.exe")
+        if os.path.exists(excelcnv_path):
+            return excelcnv_path
+    return None
+
+
+# Located once at import; repairs prefer the converter over COM when it exists
+_EXCELCNV_PATH = _find_excelcnv() if IS_WINDOWS else None
+
+
+def _classify_chunk(start, differences, include_cfo_values, explanations):
+    """
+    Classify one chunk of rows in a worker process.
+    
+    Args:
+        start: Offset of the chunk's first row
+        differences: Difference column values for the chunk
+        include_cfo_values: Include in CFO Cert Letter column values for the chunk
+        explanations: Explanation column values for the chunk
+        
+    Returns:
+        tuple: (COMMENT_* code per row, invalid row offsets relative to the full column)
+    """
+    codes, invalid_rows = _classify_do_comments(differences, include_cfo_values, explanations)
+    return codes, np.asarray(invalid_rows, dtype=np.intp) + start
+
+
+def _classify_pool(row_count: int, processes: Optional[int] = None):
+    """
+    Start a process pool for classifying a sheet's rows, if it is worth one.
+    
+    Callers that classify a sheet in several chunks start the pool once and
+    pass it to each _classify_do_comments_parallel call, so the workers
+    import their modules once per sheet rather than once per chunk.
+    
+    Args:
+        row_count: Number of rows the sheet will classify
+        processes: Number of worker processes (defaults to the CPU count)
+        
+    Returns:
+        Pool or None: Started pool, or None if the rows should be classified in-process
+    """
+    processes = processes or os.cpu_count() or 1
+    if not NUMPY_AVAILABLE or row_count <= PARALLEL_CLASSIFY_ROW_THRESHOLD or processes < 2:
+        return None
+    try:
+        return get_context("spawn").Pool(processes)
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Could not start classification pool, classifying in-process: {e}")
+        return None
+
+
+def _classify_do_comments_parallel(differences, include_cfo_values, explanations, processes=None, pool=None):
+    """
+    Classify rows for the DO Comments column across a process pool.
+    
+    Each row depends only on its own values, so the columns are split into
+    contiguous chunks and classified independently. Sheets at or below
+    PARALLEL_CLASSIFY_ROW_THRESHOLD rows are classified in-process because
+    pool startup would dominate.
+    
+    Args:
+        differences: Difference column values
+        include_cfo_values: Include in CFO Cert Letter column values
+        explanations: Explanation column values
+        processes: Number of worker processes (defaults to the CPU count)
+        pool: Pool from _classify_pool to reuse; without one a pool is started for this call
+        
+    Returns:
+        tuple: (COMMENT_* code per row, offsets of rows with invalid differences)
+    """
+    count = len(differences)
+    processes = processes or os.cpu_count() or 1
+    
+    if not NUMPY_AVAILABLE or count <= PARALLEL_CLASSIFY_ROW_THRESHOLD or processes < 2:
+        return _classify_do_comments(differences, include_cfo_values, explanations)
+    
+    differences = list(differences)
+    include_cfo_values = list(include_cfo_values)
+    explanations = list(explanations)
+    chunks = []
+    for offsets in np.array_split(np.arange(count), processes):
+        if len(offsets):
+            start, stop = int(offsets[0]), int(offsets[-1]) + 1
+            chunks.append((start, differences[start:stop], include_cfo_values[start:stop], explanations[start:stop]))
+    
+    try:
+        if pool is not None:
+            parts = pool.starmap(_classify_chunk, chunks)
+        else:
+            with get_context("spawn").Pool(len(chunks)) as pool:
+                parts = pool.starmap(_classify_chunk, chunks)
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Parallel classification failed, classifying in-process: {e}")
+        return _classify_do_comments(differences, include_cfo_values, explanations)
+    
+    codes = np.concatenate([part[0] for part in parts])
+    invalid_rows = np.concatenate([part[1] for part in parts])
+    return codes, invalid_rows
+
+
+def _process_file_worker(task: Tuple[Dict[str, Any], str, Optional[str]]) -> Tuple[Optional[str], Optional[tuple]]:
+    """
+    Process one file in a worker process of ExcelProcessor.process_files.
+    
+    The worker's processor reports to a local queue; only its final result
+    message is returned, for the parent to forward to its own queue.
+    
+    Args:
+        task: (processor configuration attributes to apply, path to the Excel file, sheet protection password)
+        
+    Returns:
+        tuple: (path of the output file or None if processing failed, last ("success"/"warning"/"error", message) or None)
+    """
+    settings, file_path, password = task
+    messages = Queue()
+    processor = ExcelProcessor(messages)
+    for name, value in settings.items():
+        setattr(processor, name, value)
+    processor.process_file(file_path, password)
+    
+    result_message = None
+    while not messages.empty():
+        message = messages.get_nowait()
+        if message[0] in ("success", "warning", "error"):
+            result_message = message
+    return processor.last_output_file, result_message
+
+
+class _Throttle:
+    """
+    Forward only every ``every``-th call to a callback.
+    
+    Used to report progress from row loops without sending a queue message
+    per row.
+    """
+    
+    def __init__(self, fn, every: int = 1000):
+        self.fn = fn
+        self.every = every
+        self.calls = 0
+    
+    def __call__(self, *args):
+        self.calls += 1
+        if self.calls % self.every == 0:
+            self.fn(*args)
+
+
 class ExcelProcessor:
     """
     Handles Excel file processing operations including file manipulation,
     formatting, and content analysis for SF132 to SF133 reconciliation.
     """
     
+    # Whether the missing-lxml warning has been logged in this process
+    _lxml_warning_logged = False
+    
     def __init__(self, queue: Optional[Queue] = None):
         """
         Initialize the Excel processor.
@@ -83,6 +815,7 @@ class ExcelProcessor:
         self.queue = queue
         self._setup_logging()
         self._temp_files = []  # Track temp files for cleanup
+        self._temp_dir = None  # Temp directory for the file being processed
         
         # Default configuration
         self.sheet_name = DEFAULT_SHEET_NAME
@@ -90,12 +823,57 @@ class ExcelProcessor:
         self.headers_to_find = DEFAULT_HEADERS_TO_FIND
         self.output_directory = DEFAULT_OUTPUT_DIR
         
+        # Write fresh workbooks with xlsxwriter when it is installed
+        self.fast_writer = False
+        
+        # (monotonic time, value) of the last progress update sent
+        self._last_progress = (float('-inf'), None)
+        
+        # (value, message) of the last progress update that was held back
+        self._pending_progress = None
+        
+        # Reopen output files with openpyxl, and Excel where available, to validate them
+        self.deep_validate = False
+        
+        # Rows and columns written by the last fresh-workbook pass
+        self.last_write_stats = None
+        
+        # Output file written by the last successful process_file call
+        self.last_output_file = None
+        
+        # Worker processes used to classify large sheets (None uses the CPU count)
+        self.classify_processes = None
+        
+        # (monotonic time, Excel PIDs) from the last process scan
+        self._excel_scan = None
+        
+        # Excel COM application shared by the COM steps of process_file
+        self._excel = None
+        
+        # Thread on which this processor initialized COM
+        self._com_thread = None
+        
+        # Whether close_excel_instances already ran for the current repair
+        self._excel_closed = False
+        
         # Create output directory
         os.makedirs(self.output_directory, exist_ok=True)
         
+        # Output directory already created, so later calls can skip the mkdir
+        self._created_output_dir = self.output_directory
+        
+        # Timestamp of the last generated output filename and how many shared it
+        self._filename_stamp = (None, 0)
+        
     def _setup_logging(self):
         """Configure logging for the processor."""
         self.logger = logging.getLogger(__name__)
+        
+        # Warn about the slow XML writer once, and not again from worker processes
+        if (OPENPYXL_AVAILABLE and not LXML_AVAILABLE and not ExcelProcessor._lxml_warning_logged
+                and parent_process() is None):
+            ExcelProcessor._lxml_warning_logged = True
+            self.logger.warning("lxml is not installed - openpyxl will save workbooks with the slower stdlib XML writer")
     
     def __del__(self):
         """Clean up resources when instance is destroyed."""
@@ -111,17 +889,51 @@ class ExcelProcessor:
                 except Exception as e:
                     self.logger.warning(f"Failed to clean up temp file {temp_file}: {e}")
     
+    def _cleanup_temp_dir(self):
+        """Remove the temp directory of the file being processed."""
+        if self._temp_dir is None:
+            return
+        try:
+            self._temp_dir.cleanup()
+            self.logger.debug(f"Cleaned up temp directory: {self._temp_dir.name}")
+        except Exception as e:
+            self.logger.warning(f"Failed to clean up temp directory {self._temp_dir.name}: {e}")
+        self._temp_dir = None
+    
     def _update_progress(self, value: float, message: str):
         """
         Update progress through the queue.
         
+        An update that arrives within PROGRESS_MIN_INTERVAL of the last one
+        and moves the bar less than PROGRESS_MIN_STEP is not queued; completion
+        is always sent. The latest held-back update is queued ahead of the next
+        one that is sent, so the bar never stays on a stale value. Every
+        message is logged.
+        
         Args:
             value: Progress value (0-100)
             message: Status message
         """
+        self.logger.info(message)
+        
+        now = time.monotonic()
+        last_time, last_value = self._last_progress
+        if (value < 100 and last_value is not None and now - last_time < PROGRESS_MIN_INTERVAL
+                and abs(value - last_value) < PROGRESS_MIN_STEP):
+            self._pending_progress = (value, message)
+            return
+        self._last_progress = (now, value)
+        
         if self.queue:
+            self._flush_progress()
             self.queue.put(("progress", (value, message)))
-        self.logger.info(message)
+        self._pending_progress = None
+    
+    def _flush_progress(self):
+        """Queue the progress update that was last held back, if any."""
+        if self.queue and self._pending_progress is not None:
+            self.queue.put(("progress", self._pending_progress))
+        self._pending_progress = None
     
     def _update_status(self, message: str):
         """
@@ -131,6 +943,7 @@ class ExcelProcessor:
             message: Status message
         """
         if self.queue:
+            self._flush_progress()
             self.queue.put(("status", message))
         self.logger.info(message)
     
@@ -138,6 +951,18 @@ class ExcelProcessor:
         """Terminate all existing Excel processes to prevent file locking."""
         self._update_status("Ensuring all Excel instances are closed...")
         
+        # Quit our own Excel instance cleanly before looking for others
+        self._dispose_excel()
+        self._excel_closed = True
+        
+        # Nothing else to do when no Excel process is running
+        try:
+            import psutil
+            if not self._find_excel_pids(psutil):
+                return
+        except ImportError:
+            pass
+        
         # Use the module version if available
         if handler_close_excel_instances:
             try:
@@ -148,48 +973,34 @@ class ExcelProcessor:
                 self.logger.warning(f"Handler close_excel_instances failed: {e}")
                 # Fall through to local implementation
         
-        try:
-            import psutil
-            excel_pids = []
-            
-            # First find all Excel processes, including COM components
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                try:
-                    # Check both process name and command line for Excel references
-                    proc_name = proc.info.get('name', '').upper()
-                    cmd_line = ' '.join(proc.info.get('cmdline', [])).upper() if proc.info.get('cmdline') else ''
-                    
-                    # Look for any Excel-related processes
-                    if any(excel_marker in proc_name for excel_marker in ['EXCEL', 'EXCEL.EXE', 'MICROSOFT EXCEL']) or \
-                       any(excel_marker in cmd_line for excel_marker in ['EXCEL.EXE', 'EXCELCNV', 'DCOM']):
-                        excel_pids.append(proc.info['pid'])
-                except Exception:
-                    pass
-            
-            if excel_pids:
-                self._update_status(f"Found {len(excel_pids)} Excel-related processes to close")
+        # First try graceful termination with COM cleanup
+        if IS_WINDOWS and WINDOWS_COM_AVAILABLE:
+            try:
+                self._init_com()
                 
-            # First try graceful termination with COM cleanup
-            if IS_WINDOWS and WINDOWS_COM_AVAILABLE:
+                # Try to quit any remaining Excel applications through COM
                 try:
-                    # Initialize COM
-                    pythoncom.CoInitialize()
-                    
-                    # Try to quit any remaining Excel applications through COM
-                    try:
-                        excel = win32com.client.GetActiveObject("Excel.Application")
-                        excel.DisplayAlerts = False
-                        excel.Quit()
-                        del excel
-                        gc.collect()
-                        self.logger.info("Gracefully closed active Excel application via COM")
-                    except:
-                        pass
-                    
-                    # Uninitialize COM
-                    pythoncom.CoUninitialize()
+                    excel = win32com.client.GetActiveObject("Excel.Application")
+                    excel.DisplayAlerts = False
+                    excel.Quit()
+                    del excel
+                    self._release_com_objects()
+                    self.logger.info("Gracefully closed active Excel application via COM")
                 except:
                     pass
+            except:
+                pass
+        
+        try:
+            import psutil
+            excel_pids = self._find_excel_pids(psutil)
+            
+            if not excel_pids:
+                # Nothing to wait for; just release any COM objects
+                gc.collect()
+                return
+            
+            self._update_status(f"Found {len(excel_pids)} Excel-related processes to close")
                     
             # Then terminate each process with proper cleanup
             for pid in excel_pids:
@@ -200,29 +1011,18 @@ class ExcelProcessor:
                 except Exception as e:
                     self.logger.warning(f"Failed to terminate Excel process (PID {pid}): {e}")
                     # Try more aggressive termination
-                    try:
-                        if psutil.pid_exists(pid):
-                            os.kill(pid, 9)  # SIGKILL or equivalent on Windows
-                    except Exception:
-                        pass
+                    if psutil.pid_exists(pid):
+                        self._force_kill_pid(pid)
             
             # Verify all processes are terminated
             remaining = []
             for pid in excel_pids:
                 if psutil.pid_exists(pid):
                     remaining.append(pid)
+            self._excel_scan = (time.monotonic(), remaining)
                     
             if remaining:
                 self.logger.warning(f"Could not terminate {len(remaining)} Excel processes: {remaining}")
-                # For stubborn processes, try the Windows-specific taskkill command
-                if IS_WINDOWS:
-                    try:
-                        import subprocess
-                        self._update_status("Using system taskkill command for stubborn Excel processes...")
-                        subprocess.run(['taskkill', '/F', '/IM', 'EXCEL.EXE'], 
-                                      stderr=subprocess.PIPE, stdout=subprocess.PIPE)
-                    except Exception as e:
-                        self.logger.warning(f"Taskkill failed: {e}")
             else:
                 self._update_status("All Excel processes successfully closed")
                 
@@ -235,10 +1035,118 @@ class ExcelProcessor:
         except ImportError:
             self.logger.warning("psutil module not available, cannot close Excel instances")
 
+    def _init_com(self) -> None:
+        """
+        Initialize COM on the current thread once for this processor.
+        
+        Repeated calls on the same thread do nothing, so COM steps can call
+        this freely; process_file undoes it with _uninit_com when it ends.
+        """
+        if not WINDOWS_COM_AVAILABLE or self._com_thread == threading.get_ident():
+            return
+        try:
+            pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+            self._com_thread = threading.get_ident()
+        except pythoncom.com_error as e:
+            # RPC_E_CHANGED_MODE: the thread already uses COM in another mode, which still works
+            self.logger.debug(f"COM already initialized on this thread: {e}")
+    
+    def _uninit_com(self) -> None:
+        """Undo _init_com if it initialized COM on the current thread."""
+        if self._com_thread != threading.get_ident():
+            return
+        try:
+            pythoncom.CoUninitialize()
+        except Exception as e:
+            self.logger.debug(f"COM uninitialize failed: {e}")
+        self._com_thread = None
+    
+    def _release_com_objects(self) -> None:
+        """
+        Release COM objects left behind by a closed Excel instance.
+        
+        Call after the last references to Excel objects are deleted. A single
+        collection breaks any reference cycles holding COM proxies; pumping
+        waiting messages lets Excel finish shutting down and
+        CoFreeUnusedLibraries unloads servers no longer in use.
+        """
+        gc.collect()
+        if WINDOWS_COM_AVAILABLE:
+            try:
+                pythoncom.PumpWaitingMessages()
+                pythoncom.CoFreeUnusedLibraries()
+            except Exception as e:
+                self.logger.debug(f"COM release failed: {e}")
+
+    def _force_kill_pid(self, pid: int) -> bool:
+        """
+        Kill a process immediately, without spawning a helper process.
+        
+        Args:
+            pid: Process ID to kill
+            
+        Returns:
+            bool: Whether the kill was issued
+        """
+        try:
+            if IS_WINDOWS:
+                kernel32 = ctypes.windll.kernel32
+                handle = kernel32.OpenProcess(PROCESS_TERMINATE, False, pid)
+                if not handle:
+                    return False
+                try:
+                    return bool(kernel32.TerminateProcess(handle, 1))
+                finally:
+                    kernel32.CloseHandle(handle)
+            
+            os.kill(pid, signal.SIGKILL)
+            return True
+        except Exception as e:
+            self.logger.warning(f"Failed to kill process (PID {pid}): {e}")
+            return False
+    
+    def _find_excel_pids(self, psutil) -> List[int]:
+        """
+        Find running Excel processes, reusing a scan made moments ago.
+        
+        Processes are matched by name; the command line is only read for
+        processes whose name could not be read.
+        
+        Args:
+            psutil: The imported psutil module
+            
+        Returns:
+            List[int]: PIDs of Excel-related processes
+        """
+        if self._excel_scan is not None:
+            scanned_at, pids = self._excel_scan
+            if time.monotonic() - scanned_at < EXCEL_SCAN_CACHE_SECONDS:
+                return list(pids)
+        
+        excel_pids = []
+        for proc in psutil.process_iter(attrs=['pid', 'name']):
+            try:
+                proc_name = proc.info['name']
+                if proc_name:
+                    if 'excel' in proc_name.lower():
+                        excel_pids.append(proc.info['pid'])
+                    continue
+                
+                cmd_line = ' '.join(proc.cmdline()).upper()
+                if any(marker in cmd_line for marker in _EXCEL_CMDLINE_MARKERS):
+                    excel_pids.append(proc.info['pid'])
+            except Exception:
+                pass
+        
+        self._excel_scan = (time.monotonic(), excel_pids)
+        return list(excel_pids)
+
     def process_file(self, original_file: str, password: str = None) -> bool:
         """
         Main processing function for Excel file.
         
+        On success the output path is kept in last_output_file.
+        
         Args:
             original_file: Path to original Excel file
             password: Sheet protection password
@@ -246,11 +1154,19 @@ class ExcelProcessor:
         Returns:
             bool: True if processing was successful, False otherwise
         """
+        self.last_output_file = None
         try:
             # Convert to absolute path
             original_file = os.path.abspath(original_file)
             self._update_status(f"Processing file: {original_file}")
             
+            # All temp files for this file go in one directory, removed in one step
+            self._temp_dir = tempfile.TemporaryDirectory(prefix="sf132_", dir=os.environ.get(TEMP_DIR_ENV_VAR))
+            
+            # Basic validation of input file; retrying cannot fix these errors
+            file_size = self._validate_file(original_file)
+            self.logger.info(f"Input file size: {file_size} bytes")
+            
             # Maximum number of attempts for the overall process
             max_attempts = 3
             attempt_count = 0
@@ -265,8 +1181,9 @@ class ExcelProcessor:
                 backup_name = f"{Path(original_file).stem}_original_backup_{timestamp}.xlsx"
                 backup_path = str(backup_dir / backup_name)
                 
-                # Copy the original file
-                shutil.copy2(original_file, backup_path)
+                # A copy-on-write clone where supported, a full copy otherwise; a hard
+                # link would share the inode, so rewriting the original would change it
+                self._clone_file(original_file, backup_path)
                 self._update_status(f"Created original backup at: {backup_path}")
             except Exception as e:
                 self.logger.warning(f"Could not create original backup: {e}")
@@ -277,8 +1194,6 @@ class ExcelProcessor:
                     attempt_count += 1
                     self._update_status(f"Processing attempt {attempt_count}/{max_attempts}")
                     
-                    # Basic validation of input file
-                    self._validate_file(original_file)
                     new_file = self._generate_new_filename(original_file)
                     
                     # Ensure Excel is fully closed before starting
@@ -292,23 +1207,10 @@ class ExcelProcessor:
                         # Fall back to direct copy if verified copy fails
                         temp_copy = self._get_temp_file_path("direct_temp_copy")
                         
-                        # Use low-level file copy for reliability
-                        try:
-                            # Use a larger buffer for faster copying
-                            buffer_size = 10 * 1024 * 1024  # 10MB buffer
-                            
-                            with open(original_file, 'rb') as src, open(temp_copy, 'wb') as dst:
-                                while True:
-                                    chunk = src.read(buffer_size)
-                                    if not chunk:
-                                        break
-                                    dst.write(chunk)
-                        except Exception:
-                            # Fall back to simple copy
-                            shutil.copy2(original_file, temp_copy)
+                        self._fast_copy(original_file, temp_copy)
                         
                         # Verify the copy exists and has content
-                        if not os.path.exists(temp_copy) or os.path.getsize(temp_copy) == 0:
+                        if _file_size(temp_copy) == 0:
                             raise ValueError("Failed to create a valid copy of the original file")
                     
                     # Main processing approaches in order of preference:
@@ -322,11 +1224,12 @@ class ExcelProcessor:
                     
                     if success:
                         self._update_progress(95, "Validating final workbook...")
-                        if self._validate_excel_file(new_file):
+                        if self._output_file_valid(new_file):
                             self._update_progress(100, "Processing complete")
                             self._update_status(f"Successfully created and processed: {new_file}")
                             if self.queue:
                                 self.queue.put(("success", f"File processed successfully. Output saved to: {new_file}"))
+                            self.last_output_file = new_file
                             return True
                         else:
                             # If validation fails, try repair process
@@ -335,6 +1238,7 @@ class ExcelProcessor:
                                 self._update_status("File repaired successfully")
                                 if self.queue:
                                     self.queue.put(("success", f"File processed and repaired. Output saved to: {new_file}"))
+                                self.last_output_file = new_file
                                 return True
                             else:
                                 # If repair failed but this is the last attempt, continue with the file anyway
@@ -342,6 +1246,7 @@ class ExcelProcessor:
                                     self._update_status("Repair failed but providing file anyway")
                                     if self.queue:
                                         self.queue.put(("warning", f"File processed with warnings. Output saved to: {new_file}"))
+                                    self.last_output_file = new_file
                                     return True
                                 
                                 # Otherwise, try next approach
@@ -357,6 +1262,7 @@ class ExcelProcessor:
                         self._update_status(f"Successfully processed with legacy method: {new_file}")
                         if self.queue:
                             self.queue.put(("success", f"File processed successfully. Output saved to: {new_file}"))
+                        self.last_output_file = new_file
                         return True
                         
                     # If everything failed, try again with a delay
@@ -365,7 +1271,6 @@ class ExcelProcessor:
                     if attempt_count < max_attempts:
                         # Clear resources before next attempt
                         self.close_excel_instances()
-                        gc.collect()
                         time.sleep(3)  # Wait before next attempt
                         
                         # Special error handling for subsequent attempts
@@ -373,24 +1278,27 @@ class ExcelProcessor:
                             # On the last attempt, try more aggressive resource cleanup
                             self._update_status("Performing aggressive resource cleanup before final attempt...")
                             
-                            # Force garbage collection multiple times
-                            for _ in range(3):
-                                gc.collect()
-                                time.sleep(1)
+                            # One collection releases any COM proxies still held in cycles
+                            self._release_com_objects()
                             
                             # On Windows, try to find and kill any hidden Excel processes
                             if IS_WINDOWS:
                                 try:
-                                    import subprocess
-                                    # Use taskkill with force option
-                                    subprocess.run(['taskkill', '/F', '/IM', 'EXCEL.EXE', '/T'], 
-                                                  stderr=subprocess.PIPE, stdout=subprocess.PIPE)
-                                except:
+                                    import psutil
+                                    for pid in self._find_excel_pids(psutil):
+                                        self._force_kill_pid(pid)
+                                except ImportError:
                                     pass
                     
                 except Exception as attempt_error:
                     self.logger.error(f"Attempt {attempt_count} failed: {attempt_error}", exc_info=True)
                     
+                    if isinstance(attempt_error, _NON_RETRYABLE_ERRORS):
+                        # Another attempt would fail the same way
+                        if self.queue:
+                            self.queue.put(("error", f"Processing failed: {str(attempt_error)}"))
+                        return False
+                    
                     if attempt_count >= max_attempts:
                         # If we've exhausted all attempts, report the error
                         if self.queue:
@@ -399,7 +1307,6 @@ class ExcelProcessor:
                     
                     # Clean up and prepare for next attempt
                     self.close_excel_instances()
-                    gc.collect()
                     time.sleep(2)
             
             # If we get here, all attempts have failed
@@ -414,8 +1321,80 @@ class ExcelProcessor:
             return False
         finally:
             # Final cleanup
+            self._dispose_excel()
+            self._uninit_com()
+            self._cleanup_temp_dir()
             self._cleanup_temp_files()
     
+    def process_files(self, file_paths: List[str], password: str = None,
+                      max_workers: Optional[int] = None) -> List[Optional[str]]:
+        """
+        Process several Excel files, each in its own worker process.
+        
+        Every worker runs process_file with a fresh processor that has this
+        processor's configuration and classifies in-process, since pool
+        workers cannot start pools of their own. Each worker's final result
+        message is forwarded to this processor's queue. Files whose name
+        repeats an earlier one are processed here afterwards, so their
+        timestamped outputs cannot collide.
+        
+        process_file closes every running Excel instance, so when Excel COM
+        automation is available the files are processed one at a time unless
+        max_workers says otherwise.
+        
+        Args:
+            file_paths: Paths to the Excel files
+            password: Sheet protection password used for every file
+            max_workers: Number of worker processes (defaults to one per file, up to the CPU count)
+            
+        Returns:
+            List[Optional[str]]: Output file of each input, or None where processing failed, in the order given
+        """
+        if max_workers is None:
+            max_workers = 1 if WINDOWS_COM_AVAILABLE else min(len(file_paths), os.cpu_count() or 1)
+        
+        results = [None] * len(file_paths)
+        remaining = set(range(len(file_paths)))
+        parallel = []
+        stems = set()
+        for index, file_path in enumerate(file_paths):
+            stem = Path(file_path).stem.lower()
+            if max_workers > 1 and stem not in stems:
+                parallel.append(index)
+            stems.add(stem)
+        
+        if len(parallel) > 1:
+            settings = {
+                'sheet_name': self.sheet_name,
+                'header_row': self.header_row,
+                'headers_to_find': self.headers_to_find,
+                'output_directory': self.output_directory,
+                'fast_writer': self.fast_writer,
+                'deep_validate': self.deep_validate,
+                'classify_processes': 1,
+            }
+            tasks = [(settings, file_paths[index], password) for index in parallel]
+            self._update_status(f"Processing {len(tasks)} files in {min(max_workers, len(tasks))} worker processes...")
+            try:
+                with get_context("spawn").Pool(min(max_workers, len(tasks))) as pool:
+                    for done, (index, (output_file, result_message)) in enumerate(
+                            zip(parallel, pool.imap(_process_file_worker, tasks)), start=1):
+                        results[index] = output_file
+                        remaining.discard(index)
+                        if self.queue and result_message is not None:
+                            self.queue.put(result_message)
+                        self._update_progress(100 * done / len(file_paths), f"Processed {done} of {len(file_paths)} files")
+            except Exception as e:
+                self.logger.warning(f"Parallel file processing failed, processing the remaining files in-process: {e}")
+        
+        for index in sorted(remaining):
+            self.process_file(file_paths[index], password)
+            results[index] = self.last_output_file
+        
+        succeeded = sum(output_file is not None for output_file in results)
+        self._update_status(f"Processed {succeeded} of {len(file_paths)} files successfully")
+        return results
+    
     def _create_verified_copy(self, original_file: str) -> str:
         """
         Create a verified copy of the original file to prevent corruption.
@@ -429,14 +1408,16 @@ class ExcelProcessor:
         temp_copy = self._get_temp_file_path("verified_copy")
         self._update_status(f"Creating verified copy at {temp_copy}...")
         
-        # Use native Excel to create a clean copy (most reliable method)
+        # A file openpyxl can already read needs no repair, so skip starting Excel
+        if self._opens_with_sheets(original_file):
+            self._fast_copy(original_file, temp_copy)
+            return temp_copy
+        self.logger.warning(f"openpyxl could not open {original_file}, repairing through Excel")
+        
+        # Use native Excel to repair the file into a clean copy
         try:
             if WINDOWS_COM_AVAILABLE:
-                # Start Excel
-                pythoncom.CoInitialize()
-                excel = win32com.client.Dispatch("Excel.Application")
-                excel.Visible = False
-                excel.DisplayAlerts = False
+                excel = self._ensure_excel()
                 
                 # Open workbook with recovery options
                 wb = excel.Workbooks.Open(
@@ -447,42 +1428,148 @@ class ExcelProcessor:
                 )
                 
                 # Save as a new clean file
-                wb.SaveAs(
-                    temp_copy,
-                    FileFormat=51,  # xlOpenXMLWorkbook
-                    CreateBackup=False
-                )
-                
-                # Clean close
-                wb.Close(SaveChanges=False)
-                excel.Quit()
-                
-                # Force cleanup
-                del wb
-                del excel
-                gc.collect()
-                pythoncom.CoUninitialize()
+                try:
+                    wb.SaveAs(
+                        temp_copy,
+                        FileFormat=51,  # xlOpenXMLWorkbook
+                        CreateBackup=False
+                    )
+                finally:
+                    # Close the workbook but leave Excel running for later steps
+                    wb.Close(SaveChanges=False)
+                    del wb
                 
                 # Verify file exists and has content
-                if not os.path.exists(temp_copy) or os.path.getsize(temp_copy) == 0:
+                if _file_size(temp_copy) == 0:
                     raise ValueError("Failed to create valid copy")
                     
                 return temp_copy
             else:
                 # If COM is not available, use regular copy
-                shutil.copy2(original_file, temp_copy)
+                self._fast_copy(original_file, temp_copy)
                 return temp_copy
                 
         except Exception as e:
             self.logger.warning(f"COM copy failed: {e}, falling back to direct copy")
             
             # Fallback to direct copy
-            shutil.copy2(original_file, temp_copy)
+            self._fast_copy(original_file, temp_copy)
             return temp_copy
     
+    def _output_file_valid(self, file_path: str) -> bool:
+        """
+        Validate a processed workbook the way process_file does.
+        
+        Args:
+            file_path: Path to Excel file to check
+            
+        Returns:
+            bool: Whether the file passed validation
+        """
+        if self.deep_validate:
+            return self._validate_excel_file(file_path)
+        return self._check_output_file(file_path)
+    
+    def _check_output_file(self, file_path: str) -> bool:
+        """
+        Cheaply check a workbook written by this processor.
+        
+        The zip central directory must list the workbook part and at least
+        one worksheet, and the processed sheet must carry the DO Comments
+        header. Only the sheet's rows up to the header are parsed.
+        
+        Args:
+            file_path: Path to Excel file to check
+            
+        Returns:
+            bool: Whether the file looks like a complete workbook
+        """
+        if _file_size(file_path) < MIN_XLSX_SIZE:
+            self.logger.warning(f"Output file is missing or too small: {file_path}")
+            return False
+        
+        if not self._validate_xlsx_structure(file_path, check_crc=False):
+            return False
+        
+        if not self._has_processed_sheet(file_path):
+            return False
+        
+        if self.last_write_stats:
+            self._update_status(
+                f"Output written: {self.last_write_stats['rows']} rows x {self.last_write_stats['columns']} columns"
+            )
+        return True
+    
+    def _has_processed_sheet(self, file_path: str) -> bool:
+        """
+        Check that a workbook has the processed sheet with its DO Comments header.
+        
+        Args:
+            file_path: Path to Excel file to check
+            
+        Returns:
+            bool: Whether the sheet exists and its header row has a DO Comments cell
+        """
+        if not OPENPYXL_AVAILABLE:
+            return True
+        try:
+            wb = openpyxl.load_workbook(file_path, read_only=True, keep_links=False)
+            try:
+                if self.sheet_name not in wb.sheetnames:
+                    self.logger.warning(f"Sheet '{self.sheet_name}' not found in {file_path}")
+                    return False
+                header = next(wb[self.sheet_name].iter_rows(
+                    min_row=self.header_row, max_row=self.header_row, values_only=True
+                ), ())
+            finally:
+                wb.close()
+        except Exception as e:
+            self.logger.warning(f"Could not open {file_path} with openpyxl: {e}")
+            return False
+        
+        if "DO Comments" not in header:
+            self.logger.warning(f"DO Comments header not found on row {self.header_row} of {file_path}")
+            return False
+        return True
+    
+    def _validate_xlsx_structure(self, file_path: str, check_crc: bool = True) -> bool:
+        """
+        Check an xlsx file at the zip container level, without parsing any XML.
+        
+        Args:
+            file_path: Path to Excel file to check
+            check_crc: Whether to read every member and verify its CRC
+            
+        Returns:
+            bool: Whether the archive is intact and has the workbook parts
+        """
+        try:
+            with zipfile.ZipFile(file_path) as archive:
+                names = set(archive.namelist())
+                
+                required_parts = {"[Content_Types].xml", "xl/workbook.xml"}
+                if not required_parts <= names or not any(name.startswith("xl/worksheets/") for name in names):
+                    self.logger.warning(f"File is missing workbook parts: {file_path}")
+                    return False
+                
+                bad_member = archive.testzip() if check_crc else None
+        except (zipfile.BadZipFile, zlib.error, OSError) as e:
+            self.logger.warning(f"File is not a valid xlsx archive: {e}")
+            return False
+        
+        if bad_member is not None:
+            self.logger.warning(f"Corrupt member {bad_member} in {file_path}")
+            return False
+        return True
+    
     def _validate_excel_file(self, file_path: str) -> bool:
         """
-        Validate an Excel file by trying to open it and check for errors.
+        Validate an Excel file by opening it once in read-only mode.
+        
+        The zip container is checked first, so a corrupt file is rejected
+        without parsing it. The file must contain the processed sheet. When
+        deep_validate is set the file is also opened in Excel through COM to
+        check for errors Excel itself would report.
         
         Args:
             file_path: Path to Excel file to validate
@@ -490,151 +1577,149 @@ class ExcelProcessor:
         Returns:
             bool: Whether the file is valid
         """
+        if not self._validate_xlsx_structure(file_path):
+            return False
+        
         try:
-            # Method 1: Try opening with openpyxl
             if OPENPYXL_AVAILABLE:
-                wb = openpyxl.load_workbook(file_path, read_only=True)
+                wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
                 sheet_names = wb.sheetnames
                 wb.close()
+                if self.sheet_name not in sheet_names:
+                    self.logger.warning(f"Sheet '{self.sheet_name}' not found in {file_path}")
+                    return False
                 self._update_status(f"Basic validation with openpyxl successful. Found {len(sheet_names)} sheets.")
             
-            # Method 2: Verify with Excel COM if possible
-            if WINDOWS_COM_AVAILABLE:
-                # Make sure Excel is not running
-                self.close_excel_instances()
-                
-                # Initialize COM with error handling
-                try:
-                    pythoncom.CoInitialize()
-                except Exception as e:
-                    self.logger.warning(f"COM initialization failed: {e}")
-                
-                excel = None
-                wb = None
-                
-                try:
-                    # Start Excel with proper exception handling
-                    try:
-                        excel = win32com.client.Dispatch("Excel.Application")
-                        excel.Visible = False
-                        excel.DisplayAlerts = False
-                    except Exception as e:
-                        self.logger.warning(f"Excel COM initialization failed: {e}")
-                        return True  # Fall back to openpyxl validation
-                    
-                    # Try to open the file
-                    try:
-                        wb = excel.Workbooks.Open(
-                            file_path,
-                            UpdateLinks=0,
-                            ReadOnly=True
-                        )
-                    except Exception as e:
-                        self.logger.warning(f"Excel COM file open failed: {e}")
-                        return True  # Fall back to openpyxl validation
-                    
-                    # Check for errors using a more reliable method than ErrorCheckingStatus
-                    has_errors = False
-                    
-                    # Try different error checking methods
-                    try:
-                        # Method 1: Check if ErrorCheckingStatus attribute exists and use it
-                        if hasattr(excel, 'ErrorCheckingStatus'):
-                            has_errors = excel.ErrorCheckingStatus
-                        # Method 2: Use Excel's CheckWorkbookCompatibility method if available
-                        elif hasattr(wb, 'CheckCompatibility'):
-                            compatibility_issues = wb.CheckCompatibility
-                            has_errors = compatibility_issues
-                        # Method 3: Check for error alerts on sheets
-                        else:
-                            # If no direct error checking is available, check if file can be saved
-                            temp_path = self._get_temp_file_path("verify")
-                            wb.SaveAs(temp_path, FileFormat=51)  # 51 = xlsx
-                            if os.path.exists(temp_path):
-                                os.unlink(temp_path)
-                            has_errors = False
-                    except Exception as e:
-                        self.logger.debug(f"Error checking method failed: {e}")
-                        # If error checking fails, assume the file is okay if we got this far
-                        has_errors = False
-                    
-                    # Close properly
-                    if wb:
-                        try:
-                            wb.Close(SaveChanges=False)
-                        except:
-                            pass
-                        
-                    if excel:
-                        try:
-                            excel.Quit()
-                        except:
-                            pass
-                        
-                    # Cleanup COM objects
-                    if wb:
-                        del wb
-                    if excel:
-                        del excel
-                        
-                    gc.collect()
-                    
-                    try:
-                        pythoncom.CoUninitialize()
-                    except:
-                        pass
-                    
-                    if has_errors:
-                        self.logger.warning(f"Excel detected errors in {file_path}")
-                        return False
-                    
-                    self._update_status("Enhanced COM validation successful")
-                    
-                except Exception as e:
-                    self.logger.warning(f"COM validation failed: {e}")
-                    # Clean up resources on error
-                    if wb:
-                        try:
-                            wb.Close(SaveChanges=False)
-                        except:
-                            pass
-                    if excel:
-                        try:
-                            excel.Quit()
-                        except:
-                            pass
-                        
-                    # Force cleanup
-                    if wb:
-                        del wb
-                    if excel:
-                        del excel
-                    gc.collect()
-                    
-                    try:
-                        pythoncom.CoUninitialize()
-                    except:
-                        pass
-                    
-                    return True  # Fall back to openpyxl validation
-            
-            # Additional validation with pandas if available
-            if PANDAS_AVAILABLE:
-                try:
-                    excel_file = pd.ExcelFile(file_path)
-                    sheet_count = len(excel_file.sheet_names)
-                    excel_file.close()
-                    self._update_status(f"Validated file with pandas: {sheet_count} sheets")
-                except Exception as e:
-                    self.logger.warning(f"Pandas validation failed: {e}")
+            if self.deep_validate and WINDOWS_COM_AVAILABLE:
+                return self._validate_with_excel_com(file_path)
             
-            # If we got here, file seems valid
             return True
             
         except Exception as e:
             self.logger.warning(f"File validation failed: {e}")
             return False
     
+    def _validate_with_excel_com(self, file_path: str) -> bool:
+        """
+        Open a file in Excel through COM and check for reported errors.
+        
+        Args:
+            file_path: Path to Excel file to validate
+            
+        Returns:
+            bool: False only if Excel reports errors; COM failures are not treated as invalid
+        """
+        wb = None
+        
+        try:
+            # Reuse the Excel instance started for this file, if any
+            try:
+                excel = self._ensure_excel()
+            except Exception as e:
+                self.logger.warning(f"Excel COM initialization failed: {e}")
+                return True  # Fall back to openpyxl validation
+            
+            # Try to open the file
+            try:
+                wb = excel.Workbooks.Open(
+                    file_path,
+                    UpdateLinks=0,
+                    ReadOnly=True
+                )
+            except Exception as e:
+                self.logger.warning(f"Excel COM file open failed: {e}")
+                return True  # Fall back to openpyxl validation
+            
+            # Check for errors using a more reliable method than ErrorCheckingStatus
+            has_errors = False
+            
+            # Try different error checking methods
+            try:
+                # Method 1: Check if ErrorCheckingStatus attribute exists and use it
+                if hasattr(excel, 'ErrorCheckingStatus'):
+                    has_errors = excel.ErrorCheckingStatus
+                # Method 2: Use Excel's CheckWorkbookCompatibility method if available
+                elif hasattr(wb, 'CheckCompatibility'):
+                    compatibility_issues = wb.CheckCompatibility
+                    has_errors = compatibility_issues
+                # Method 3: Check for error alerts on sheets
+                else:
+                    # If no direct error checking is available, check if file can be saved
+                    temp_path = self._get_temp_file_path("verify")
+                    wb.SaveAs(temp_path, FileFormat=51)  # 51 = xlsx
+                    if os.path.exists(temp_path):
+                        os.unlink(temp_path)
+                    has_errors = False
+            except Exception as e:
+                self.logger.debug(f"Error checking method failed: {e}")
+                # If error checking fails, assume the file is okay if we got this far
+                has_errors = False
+            
+            if has_errors:
+                self.logger.warning(f"Excel detected errors in {file_path}")
+                return False
+            
+            self._update_status("Enhanced COM validation successful")
+            return True
+            
+        except Exception as e:
+            self.logger.warning(f"COM validation failed: {e}")
+            return True  # Fall back to openpyxl validation
+        
+        finally:
+            # Close the workbook but leave Excel running for later steps
+            if wb:
+                try:
+                    wb.Close(SaveChanges=False)
+                except:
+                    pass
+                del wb
+    
+    def _ensure_excel(self):
+        """
+        Return the shared Excel COM application, starting it if needed.
+        
+        The instance is kept on the processor so each COM step of a file
+        avoids Excel's start-up cost; it is quit by _dispose_excel when
+        process_file finishes or close_excel_instances runs. Screen updating
+        and events are disabled, and calculation is set to manual.
+        
+        Returns:
+            The Excel.Application COM object
+        """
+        if self._excel is not None:
+            try:
+                self._excel.Visible  # Raises if the instance has gone away
+                return self._excel
+            except Exception:
+                self._excel = None
+        
+        self._init_com()
+        
+        excel = win32com.client.Dispatch("Excel.Application")
+        excel.Visible = False
+        excel.DisplayAlerts = False
+        excel.ScreenUpdating = False
+        excel.EnableEvents = False
+        try:
+            excel.Calculation = -4135  # xlCalculationManual
+        except Exception as e:
+            # Excel refuses to change calculation mode with no workbook open
+            self.logger.debug(f"Could not set manual calculation: {e}")
+        
+        self._excel = excel
+        return excel
+    
+    def _dispose_excel(self) -> None:
+        """Quit the shared Excel COM application, if one was started."""
+        if self._excel is not None:
+            try:
+                self._excel.Quit()
+            except Exception as e:
+                self.logger.debug(f"Excel Quit failed: {e}")
+            self._excel = None
+            self._release_com_objects()
+    
     def _process_with_fresh_workbook(self, source_file: str, output_file: str, password: str) -> bool:
         """
         Process by extracting data and creating a fresh workbook to avoid corruption.
@@ -654,52 +1739,46 @@ class ExcelProcessor:
             if not OPENPYXL_AVAILABLE:
                 return False
                 
-            source_wb = openpyxl.load_workbook(source_file, data_only=True)
+            # Read-only mode streams cells from the file instead of building every sheet in memory
+            source_wb = openpyxl.load_workbook(source_file, read_only=True, data_only=True, keep_links=False)
             
             if self.sheet_name not in source_wb.sheetnames:
                 self.logger.warning(f"Required sheet '{self.sheet_name}' not found")
+                source_wb.close()
                 return False
                 
             source_sheet = source_wb[self.sheet_name]
+            self._ensure_sheet_dimensions(source_sheet)
             
-            # Create a new workbook
-            self._update_status("Creating fresh workbook...")
-            new_wb = openpyxl.Workbook()
-            
-            # Remove default sheet
-            if "Sheet" in new_wb.sheetnames:
-                new_wb.remove(new_wb["Sheet"])
-                
-            # Create new sheet with the right name
-            new_sheet = new_wb.create_sheet(title=self.sheet_name)
-            
-            # Copy all data and formatting from source
-            self._update_status("Copying data from source...")
-            self._copy_sheet_data(source_sheet, new_sheet)
-            
-            # Process the fresh sheet
+            # Analyse the source sheet up front so the output can be streamed
             self._update_progress(40, "Processing data...")
             
-            # Process column visibility
-            self._process_columns(new_sheet)
-            
             # Find column indexes
-            column_indexes = self._find_column_indexes(new_sheet)
+            column_indexes = self._find_column_indexes(source_sheet)
             
-            # Find header color
-            rgb_color = self._process_header_formatting(new_sheet)
+            # Find header color; the matching row is found while the rows are copied
+            rgb_color = self._process_header_formatting(source_sheet)
             
-            # Find matching row
-            matching_row = self._find_matching_row(new_sheet, rgb_color)
+            # Create directory if it doesn't exist
+            os.makedirs(os.path.dirname(output_file), exist_ok=True)
             
-            # Add DO Comments column
-            self._add_do_comments_column(new_sheet)
+            if self.fast_writer and XLSXWRITER_AVAILABLE:
+                self._update_status("Writing fresh workbook with xlsxwriter...")
+                rows_written = self._write_with_xlsxwriter(source_sheet, output_file, column_indexes, rgb_color)
+                source_wb.close()
+                self.last_write_stats = {'rows': rows_written, 'columns': source_sheet.max_column + 1}
+                return os.path.exists(output_file)
             
-            # Process rows with comments
-            self._process_rows_with_openpyxl(new_sheet, column_indexes, matching_row)
+            # Create a new write-only workbook - rows are serialized as they are appended
+            self._update_status("Creating fresh workbook...")
+            new_wb = openpyxl.Workbook(write_only=True)
+            new_sheet = new_wb.create_sheet(title=self.sheet_name)
+            self._ensure_comment_styles(new_wb)
             
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(output_file), exist_ok=True)
+            # Stream data, formatting and comments from source in a single pass
+            self._update_status("Copying data from source...")
+            rows_written = self._copy_sheet_data(source_sheet, new_sheet, column_indexes, rgb_color)
+            self.last_write_stats = {'rows': rows_written, 'columns': source_sheet.max_column + 1}
             
             # Save the workbook
             self._update_status("Saving processed workbook...")
@@ -719,122 +1798,380 @@ class ExcelProcessor:
             self.logger.error(f"Error in fresh workbook processing: {e}", exc_info=True)
             return False
     
-    def _copy_sheet_data(self, source_sheet, target_sheet):
+    def _copy_sheet_data(self, source_sheet, target_sheet, column_indexes: Dict[str, int], rgb_color: str):
+        """
+        Copy data and basic formatting from source sheet to a write-only target sheet.
+        
+        Rows are appended in order so the target never holds more than one
+        row in memory. The DO Comments column is added after the last source
+        column, with each row's comment classified in the same pass.
+        
+        Args:
+            source_sheet: Source read-only worksheet
+            target_sheet: Target write-only worksheet
+            column_indexes: Column index mapping
+            rgb_color: Header fill colour that marks the end of the rows to process
+            
+        Returns:
+            int: Number of rows written
+        """
+        header_row = self.header_row
+        
+        # Get dimensions of source sheet
+        max_row = source_sheet.max_row
+        max_col = source_sheet.max_column
+        comment_col = max_col + 1
+        last_row = max(max_row, header_row)
+        
+        column_widths, row_heights = self._read_sheet_dimensions(source_sheet)
+        
+        # Column and row dimensions must be set before any rows are written
+        for col_idx in range(1, max_col + 1):
+            col_letter = get_column_letter(col_idx)
+            if col_letter in column_widths:
+                tgt_col_dim = target_sheet.column_dimensions[col_letter]
+                
+                # Copy column width
+                tgt_col_dim.width = column_widths[col_letter] or 8.43  # Default width
+                
+                # Copy hidden status
+                tgt_col_dim.hidden = False  # We want all columns visible
+            else:
+                # Columns without a source dimension get an explicit visible one
+                target_sheet.column_dimensions[col_letter].hidden = False
+        
+        comment_letter = get_column_letter(comment_col)
+        target_sheet.column_dimensions[comment_letter].width = 25
+        self.logger.info(f"Added DO Comments column at position {comment_col} (column {comment_letter})")
+        
+        # Copy row heights
+        for row_idx, height in row_heights.items():
+            if row_idx <= max_row:
+                target_sheet.row_dimensions[row_idx].height = height or 15  # Default height
+        
+        # Report progress between 40% and 90% every COPY_PROGRESS_EVERY rows
+        report_progress = _Throttle(
+            lambda row_idx: self._update_progress(40 + 50 * row_idx / last_row, f"Copied {row_idx} of {last_row} rows..."),
+            every=COPY_PROGRESS_EVERY
+        )
+        
+        # The DO Comments header, and one style array per comment code; write-only
+        # cells are serialized on append, so these can be shared rather than copied
+        header_cell = WriteOnlyCell(target_sheet, value="DO Comments")
+        self._style_do_comments_header(header_cell)
+        comment_styles = {}
+        
+        # Copy cell data, basic formatting and comments one row at a time, reading
+        # the source in a single pass (random access on a read-only sheet reparses the file)
+        style_cache = {}
+        rows_written = 0
+        
+        for row_idx, src_row, comment_code in self._iter_classified_rows(source_sheet, column_indexes, rgb_color, max_col):
+            row_out = []
+            
+            for col_idx, src_cell in enumerate(src_row, start=1):
+                # Plain values are written as-is; styled cells need a WriteOnlyCell.
+                # Read-only cells carry their style index directly (0 = unstyled) and
+                # the empty placeholder cells have none.
+                style_id = getattr(src_cell, '_style_id', 0)
+                if style_id:
+                    tgt_cell = WriteOnlyCell(target_sheet, value=src_cell.value)
+                    
+                    # Translate each distinct source style once and reuse the result. Write-only
+                    # cells are serialized on append and never changed, so they can share it.
+                    cached_style = style_cache.get(style_id)
+                    if cached_style is None:
+                        self._copy_cell_style(src_cell, tgt_cell, row_idx, col_idx)
+                        style_cache[style_id] = tgt_cell._style
+                    else:
+                        tgt_cell._style = cached_style
+                    row_out.append(tgt_cell)
+                else:
+                    row_out.append(src_cell.value)
+            
+            comment_cell = None
+            if row_idx == header_row:
+                comment_cell = header_cell
+            elif comment_code is not None:
+                comment_cell = WriteOnlyCell(target_sheet, value=DO_COMMENT_TEXT[comment_code])
+                comment_style = comment_styles.get(comment_code)
+                if comment_style is None:
+                    comment_cell.style = COMMENT_STYLE_REQUIRED if comment_code == COMMENT_REQUIRED else COMMENT_STYLE_WRAP
+                    comment_styles[comment_code] = comment_cell._style
+                else:
+                    comment_cell._style = comment_style
+            
+            if comment_cell is not None:
+                row_out.extend([None] * (max_col - len(row_out)))
+                row_out.append(comment_cell)
+            
+            target_sheet.append(row_out)
+            report_progress(row_idx)
+            rows_written = row_idx
+        
+        return rows_written
+    
+    def _write_with_xlsxwriter(self, source_sheet, output_file: str, column_indexes: Dict[str, int],
+                               rgb_color: str) -> int:
+        """
+        Write the processed sheet with xlsxwriter in constant-memory mode.
+        
+        Values and the basic formatting that _copy_cell_style copies are
+        written straight from the source rows, followed by the DO Comments
+        column. Each distinct source style becomes one xlsxwriter format, and
+        column widths match the ones _copy_sheet_data writes.
+        
+        Args:
+            source_sheet: Source worksheet
+            output_file: Path for output file
+            column_indexes: Column index mapping
+            rgb_color: Header fill colour that marks the end of the rows to process
+            
+        Returns:
+            int: Number of rows written
+        """
+        header_row = self.header_row
+        max_row = source_sheet.max_row
+        max_col = source_sheet.max_column
+        comment_col = max_col + 1
+        last_row = max(max_row, header_row)
+        
+        workbook = xlsxwriter.Workbook(output_file, {
+            'constant_memory': True,
+            'strings_to_numbers': False,
+            'strings_to_formulas': False,
+            'strings_to_urls': False,
+            'default_date_format': 'yyyy-mm-dd',
+        })
+        try:
+            worksheet = workbook.add_worksheet(self.sheet_name)
+            header_format = workbook.add_format({
+                'font_name': 'Calibri', 'font_size': 11, 'font_color': '#FF0000', 'bold': True,
+                'pattern': 1, 'bg_color': '#FFFF00', 'border': 1,
+                'align': 'center', 'valign': 'vcenter', 'text_wrap': True,
+            })
+            wrap_format = workbook.add_format({'text_wrap': True, 'valign': 'vcenter', 'border': 1})
+            required_format = workbook.add_format({
+                'text_wrap': True, 'valign': 'vcenter', 'border': 1, 'pattern': 1, 'bg_color': '#FFCCCC',
+            })
+            
+            # Column widths, then rows in order - constant-memory mode flushes each finished row
+            column_widths, row_heights = self._read_sheet_dimensions(source_sheet)
+            # Same widths as _copy_sheet_data, which gives columns without a source
+            # width openpyxl's default column dimension
+            for col_idx in range(1, max_col + 1):
+                col_letter = get_column_letter(col_idx)
+                if col_letter in column_widths:
+                    width = column_widths[col_letter] or 8.43  # Default width
+                else:
+                    width = DEFAULT_COLUMN_WIDTH
+                worksheet.set_column(col_idx - 1, col_idx - 1, _xlsxwriter_width(width))
+            worksheet.set_column(comment_col - 1, comment_col - 1, _xlsxwriter_width(25))
+            
+            formats = {}
+            rows_written = 0
+            report_progress = _Throttle(
+                lambda row_idx: self._update_progress(40 + 50 * row_idx / last_row, f"Wrote {row_idx} of {last_row} rows..."),
+                every=COPY_PROGRESS_EVERY
+            )
+            
+            # Rows come with their comment code, classified in the same pass
+            classified_rows = self._iter_classified_rows(source_sheet, column_indexes, rgb_color, max_col)
+            for row_idx, src_row, comment_code in classified_rows:
+                row = row_idx - 1
+                if row_idx in row_heights and row_idx <= max_row:
+                    worksheet.set_row(row, row_heights[row_idx] or 15)
+                
+                for col_idx, src_cell in enumerate(src_row):
+                    cell_format = None
+                    style_id = getattr(src_cell, '_style_id', 0)
+                    if style_id:
+                        cell_format = formats.get(style_id)
+                        if cell_format is None:
+                            cell_format = formats[style_id] = self._xlsxwriter_format(workbook, src_cell)
+                    
+                    value = src_cell.value
+                    if value is not None:
+                        worksheet.write(row, col_idx, value, cell_format)
+                    elif cell_format is not None:
+                        worksheet.write_blank(row, col_idx, None, cell_format)
+                
+                if row_idx == header_row:
+                    worksheet.write_string(row, comment_col - 1, "DO Comments", header_format)
+                elif comment_code is not None:
+                    text = DO_COMMENT_TEXT[comment_code]
+                    cell_format = required_format if comment_code == COMMENT_REQUIRED else wrap_format
+                    if text is None:
+                        worksheet.write_blank(row, comment_col - 1, None, cell_format)
+                    else:
+                        worksheet.write_string(row, comment_col - 1, text, cell_format)
+                
+                report_progress(row_idx)
+                rows_written = row_idx
+        finally:
+            workbook.close()
+        
+        return rows_written
+    
+    def _xlsxwriter_format(self, workbook, src_cell):
+        """
+        Build an xlsxwriter format matching a source cell's basic formatting.
+        
+        Args:
+            workbook: xlsxwriter workbook
+            src_cell: Source cell
+            
+        Returns:
+            xlsxwriter Format
+        """
+        properties = {}
+        
+        font = src_cell.font
+        if font:
+            if font.name:
+                properties['font_name'] = font.name
+            if font.size:
+                properties['font_size'] = font.size
+            properties['bold'] = bool(font.bold)
+            properties['italic'] = bool(font.italic)
+            if font.color is not None and font.color.type == 'rgb' and isinstance(font.color.rgb, str):
+                properties['font_color'] = f"#{font.color.rgb[-6:]}"
+        
+        # Same rules as _copy_cell_style: no empty or black fills
+        fill = src_cell.fill
+        if fill and getattr(fill, 'fill_type', None) not in (None, 'none') and fill.start_color is not None:
+            fill_color = fill.start_color.rgb
+            if isinstance(fill_color, str) and fill_color not in _BLACK_FILL_RGBS:
+                properties['pattern'] = 1
+                properties['bg_color'] = f"#{fill_color[-6:]}"
+        
+        border = src_cell.border
+        if border:
+            for side_name in ('left', 'right', 'top', 'bottom'):
+                side = getattr(border, side_name)
+                if side is not None and side.style in XLSXWRITER_BORDERS:
+                    properties[side_name] = XLSXWRITER_BORDERS[side.style]
+        
+        alignment = src_cell.alignment
+        if alignment:
+            if alignment.horizontal and alignment.horizontal != 'general':
+                properties['align'] = 'center_across' if alignment.horizontal == 'centerContinuous' else alignment.horizontal
+            if alignment.vertical in XLSXWRITER_VALIGN:
+                properties['valign'] = XLSXWRITER_VALIGN[alignment.vertical]
+            if alignment.wrap_text:
+                properties['text_wrap'] = True
+        
+        # Like _copy_cell_style, number formats are not copied; dates get the
+        # format openpyxl gives a cell when a date value is assigned to it
+        time_format = TIME_FORMATS.get(type(src_cell.value))
+        if time_format:
+            properties['num_format'] = time_format
+        
+        return workbook.add_format(properties)
+    
+    def _ensure_sheet_dimensions(self, sheet) -> None:
+        """
+        Make sure a read-only worksheet reports its real size.
+        
+        Some writers store a missing or placeholder ``A1:A1`` dimension, which
+        would make a read-only sheet look empty. In that case the size is
+        recalculated by scanning the sheet.
+        
+        Args:
+            sheet: Read-only worksheet
+        """
+        try:
+            dimension = sheet.calculate_dimension()
+        except ValueError:
+            dimension = None
+        
+        if dimension not in (None, "A1:A1"):
+            return
+        
+        try:
+            sheet.reset_dimensions()
+            sheet.calculate_dimension(force=True)
+            self.logger.info(f"Recalculated dimensions of sheet '{sheet.title}': {sheet.calculate_dimension()}")
+        except Exception as e:
+            self.logger.warning(f"Could not recalculate sheet dimensions: {e}")
+    
+    def _read_sheet_dimensions(self, sheet) -> Tuple[Dict[str, Optional[float]], Dict[int, Optional[float]]]:
+        """
+        Read column widths and row heights from a worksheet.
+        
+        Read-only worksheets do not load dimensions, so for those the sheet
+        XML is streamed once and only the ``<col>`` and ``<row>`` attributes
+        are kept.
+        
+        Args:
+            sheet: Worksheet to read
+            
+        Returns:
+            Tuple[Dict[str, Optional[float]], Dict[int, Optional[float]]]: Column
+            widths by letter and row heights by row number
+        """
+        if hasattr(sheet, 'column_dimensions'):
+            column_widths = {letter: dim.width for letter, dim in sheet.column_dimensions.items()}
+            row_heights = {row_idx: dim.height for row_idx, dim in sheet.row_dimensions.items()}
+            return column_widths, row_heights
+        
+        column_widths = {}
+        row_heights = {}
+        col_tag = f"{{{SHEET_MAIN_NS}}}col"
+        row_tag = f"{{{SHEET_MAIN_NS}}}row"
+        sheet_data_tag = f"{{{SHEET_MAIN_NS}}}sheetData"
+        sheet_data = None
+        row_counter = 0
+        
+        with sheet._get_source() as source:
+            for event, element in iterparse(source, events=("start", "end")):
+                if event == "start":
+                    if element.tag == sheet_data_tag:
+                        sheet_data = element
+                    continue
+                
+                if element.tag == row_tag:
+                    row_counter = int(element.get('r', row_counter + 1))
+                    # Rows only get a dimension when they carry attributes beyond their position
+                    if set(element.attrib) - {'r', 'spans'}:
+                        height = element.get('ht')
+                        row_heights[row_counter] = float(height) if height is not None else None
+                    # Drop parsed rows so memory stays flat
+                    sheet_data.clear()
+                elif element.tag == col_tag:
+                    column_widths[get_column_letter(int(element.get('min')))] = float(
+                        element.get('width', DEFAULT_COLUMN_WIDTH)
+                    )
+        
+        return column_widths, row_heights
+    
+    def _copy_cell_style(self, src_cell, tgt_cell, row_idx: int, col_idx: int) -> None:
         """
-        Copy data and basic formatting from source sheet to target sheet.
+        Copy basic formatting from one cell to another.
         
         Args:
-            source_sheet: Source worksheet
-            target_sheet: Target worksheet
+            src_cell: Source cell
+            tgt_cell: Target cell
+            row_idx: Row number, for logging
+            col_idx: Column number, for logging
         """
-        # Get dimensions of source sheet
-        max_row = source_sheet.max_row
-        max_col = source_sheet.max_column
-        
-        # Copy column dimensions and properties
-        for col_idx in range(1, max_col + 1):
-            col_letter = get_column_letter(col_idx)
-            if col_letter in source_sheet.column_dimensions:
-                src_col_dim = source_sheet.column_dimensions[col_letter]
-                tgt_col_dim = target_sheet.column_dimensions[col_letter]
-                
-                # Copy column width
-                tgt_col_dim.width = src_col_dim.width if src_col_dim.width else 8.43  # Default width
-                
-                # Copy hidden status
-                tgt_col_dim.hidden = False  # We want all columns visible
-        
-        # Copy row heights
-        for row_idx in range(1, max_row + 1):
-            if row_idx in source_sheet.row_dimensions:
-                src_row_dim = source_sheet.row_dimensions[row_idx]
-                tgt_row_dim = target_sheet.row_dimensions[row_idx]
-                
-                # Copy row height
-                tgt_row_dim.height = src_row_dim.height if src_row_dim.height else 15  # Default height
+        try:
+            # Style objects are immutable, so the source's can be assigned as they are
+            tgt_cell.font = src_cell.font
+            tgt_cell.border = src_cell.border
+            tgt_cell.alignment = src_cell.alignment
+        except Exception as e:
+            self.logger.debug(f"Error copying style at {row_idx},{col_idx}: {e}")
         
-        # Copy cell data and basic formatting
-        for row_idx in range(1, max_row + 1):
-            for col_idx in range(1, max_col + 1):
-                # Get source cell
-                src_cell = source_sheet.cell(row=row_idx, column=col_idx)
-                
-                # Skip merged cells (we'll handle them separately)
-                if isinstance(src_cell, MergedCell):
-                    continue
-                    
-                # Create target cell and copy value
-                tgt_cell = target_sheet.cell(row=row_idx, column=col_idx, value=src_cell.value)
-                
-                # Copy basic formatting with proper error handling
-                if hasattr(src_cell, 'has_style') and src_cell.has_style:
-                    try:
-                        # Font
-                        tgt_cell.font = Font(
-                            name=src_cell.font.name,
-                            size=src_cell.font.size,
-                            bold=src_cell.font.bold,
-                            italic=src_cell.font.italic,
-                            color=src_cell.font.color
-                        )
-                    except Exception as e:
-                        self.logger.debug(f"Error copying font at {row_idx},{col_idx}: {e}")
-                    
-                    try:
-                        # Fill - with proper handling to avoid black fills
-                        if src_cell.fill and hasattr(src_cell.fill, 'start_color') and src_cell.fill.start_color:
-                            # Get the fill type from source
-                            fill_type = getattr(src_cell.fill, 'fill_type', 'solid')
-                            
-                            # Skip empty fills
-                            if fill_type == 'none' or fill_type is None:
-                                continue
-                                
-                            # Get the RGB color
-                            fill_color = src_cell.fill.start_color.rgb
-                            
-                            # Skip black colors (000000) or None values
-                            if not fill_color or fill_color == "00000000" or fill_color == "FF000000" or fill_color == "000000":
-                                continue
-                                
-                            # Default to white if color is invalid
-                            if not isinstance(fill_color, str) or len(fill_color) < 6:
-                                fill_color = "FFFFFF"
-                                
-                            # Ensure proper format by removing alpha channel if present
-                            if len(fill_color) == 8 and fill_color.startswith("FF"):
-                                fill_color = fill_color[2:]
-                                
-                            # Apply the fill directly with string color (more reliable than Color object)
-                            tgt_cell.fill = PatternFill(
-                                fill_type='solid',
-                                start_color=fill_color
-                            )
-                    except Exception as e:
-                        self.logger.debug(f"Error copying fill at {row_idx},{col_idx}: {e}")
-                    
-                    try:
-                        # Border
-                        if src_cell.border:
-                            tgt_cell.border = Border(
-                                left=src_cell.border.left,
-                                right=src_cell.border.right,
-                                top=src_cell.border.top,
-                                bottom=src_cell.border.bottom
-                            )
-                    except Exception as e:
-                        self.logger.debug(f"Error copying border at {row_idx},{col_idx}: {e}")
-                    
-                    try:
-                        # Alignment
-                        if src_cell.alignment:
-                            tgt_cell.alignment = Alignment(
-                                horizontal=src_cell.alignment.horizontal,
-                                vertical=src_cell.alignment.vertical,
-                                wrap_text=src_cell.alignment.wrap_text
-                            )
-                    except Exception as e:
-                        self.logger.debug(f"Error copying alignment at {row_idx},{col_idx}: {e}")
+        try:
+            # Fill - skip empty fills and black or missing colours, which show as black cells
+            fill = src_cell.fill
+            if fill and getattr(fill, 'fill_type', None) not in (None, 'none'):
+                fill_color = getattr(fill.start_color, 'rgb', None)
+                if isinstance(fill_color, str) and fill_color not in _BLACK_FILL_RGBS:
+                    tgt_cell.fill = fill
+        except Exception as e:
+            self.logger.debug(f"Error copying fill at {row_idx},{col_idx}: {e}")
     
     def _repair_workbook(self, file_path: str) -> bool:
         """
@@ -849,8 +2186,14 @@ class ExcelProcessor:
         try:
             self._update_status("Attempting to repair workbook...")
             
-            # Ensure all Excel processes are closed
-            self.close_excel_instances()
+            # Validation can fail transiently (e.g. a COM error); skip the repair only
+            # if the same validation that failed now passes
+            if self._output_file_valid(file_path):
+                self._update_status("Workbook passes validation without repair")
+                return True
+            
+            # Excel is only closed if the file turns out to be locked below
+            self._excel_closed = False
             
             # Create a backup before repair
             backup_path = None
@@ -863,8 +2206,8 @@ class ExcelProcessor:
                 backup_name = f"{Path(file_path).stem}_repair_backup_{timestamp}.xlsx"
                 backup_path = str(backup_dir / backup_name)
                 
-                # Copy the file
-                shutil.copy2(file_path, backup_path)
+                # Clone the file where the filesystem allows, otherwise copy it
+                self._clone_file(file_path, backup_path)
                 self._update_status(f"Created backup at: {backup_path}")
             except Exception as e:
                 self.logger.warning(f"Could not create backup: {e}")
@@ -876,19 +2219,13 @@ class ExcelProcessor:
             
             while retry_count < max_retries and not file_accessible:
                 try:
-                    # Test file accessibility with read/write checks
-                    with open(file_path, 'rb+') as test_file:
-                        test_file.seek(0)
-                        test_file.read(1)  # Try to read a byte
-                        test_file.seek(0)  # Go back to beginning
+                    # An unlocked file passes on the first probe, without waiting
+                    self._probe_file_lock(file_path)
                     file_accessible = True
                 except Exception as e:
                     retry_count += 1
                     self.logger.warning(f"File access retry {retry_count}/{max_retries}: {e}")
-                    
-                    # Try to release the file by forcing garbage collection
-                    gc.collect()
-                    time.sleep(2)  # Wait before retrying
+                    time.sleep(FILE_ACCESS_RETRY_DELAY * 2 ** (retry_count - 1))
                     
                     # On Windows, try additional methods to release the file
                     if IS_WINDOWS:
@@ -900,12 +2237,10 @@ class ExcelProcessor:
                                 temp_copy = self._get_temp_file_path("repair_copy")
                                 self._update_status(f"Attempting to create a copy at {temp_copy}...")
                                 
-                                # Use low-level file operations to copy
-                                with open(file_path, 'rb') as src, open(temp_copy, 'wb') as dst:
-                                    dst.write(src.read())
+                                self._fast_copy(file_path, temp_copy)
                                 
                                 # If copy succeeds, work with the copy instead
-                                if os.path.exists(temp_copy) and os.path.getsize(temp_copy) > 0:
+                                if _file_size(temp_copy) > 0:
                                     self._update_status("Working with copy since original is locked")
                                     file_path = temp_copy
                                     file_accessible = True
@@ -921,13 +2256,12 @@ class ExcelProcessor:
                 from ..modules.excel_recovery import repair_excel_file_access
                 self._update_status("Using module-based recovery...")
                 success, result_path = repair_excel_file_access(file_path)
-                if success and os.path.exists(result_path) and os.path.getsize(result_path) > 0:
+                if success and _file_size(result_path) > 0:
                     # Validate the result
                     if self._validate_repaired_file(result_path):
-                        # Replace original with repaired version
-                        if os.path.exists(file_path) and os.path.abspath(file_path) != os.path.abspath(result_path):
-                            os.unlink(file_path)
-                        shutil.copy2(result_path, file_path)
+                        # Move the repaired file over the original in one step
+                        if os.path.abspath(file_path) != os.path.abspath(result_path):
+                            self._install_file(result_path, file_path)
                         self._update_status("Module-based repair successful")
                         return True
             except ImportError:
@@ -935,13 +2269,16 @@ class ExcelProcessor:
             except Exception as e:
                 self.logger.warning(f"Module-based repair failed: {e}")
             
-            # Try multiple repair methods in sequence
+            # Try multiple repair methods in sequence, cheapest first
             repair_methods = [
-                self._repair_with_excel_com,
-                self._repair_with_pandas,
                 self._repair_with_openpyxl,
+                self._repair_with_pandas,
+                self._repair_with_excel_com,
                 self._repair_with_system_tool
             ]
+            if _EXCELCNV_PATH:
+                # The converter repairs without starting Excel, so try it before COM
+                repair_methods[2:] = [self._repair_with_system_tool, self._repair_with_excel_com]
             
             # Try each repair method until one succeeds
             for repair_method in repair_methods:
@@ -949,7 +2286,7 @@ class ExcelProcessor:
                     self._update_status(f"Trying repair method: {repair_method.__name__}")
                     success, repaired_path = repair_method(file_path)
                     
-                    if success and os.path.exists(repaired_path) and os.path.getsize(repaired_path) > 0:
+                    if success and _file_size(repaired_path) > 0:
                         # Validate the repaired file
                         if self._validate_repaired_file(repaired_path):
                             # Replace original with repaired version
@@ -958,24 +2295,12 @@ class ExcelProcessor:
                                 original_filename = os.path.basename(file_path)
                                 self._update_status(f"Replacing {original_filename} with repaired version...")
                                 
-                                # Remove original if it exists and isn't the same as the repaired file
-                                if os.path.exists(file_path) and os.path.abspath(file_path) != os.path.abspath(repaired_path):
-                                    try:
-                                        os.unlink(file_path)
-                                    except Exception as e:
-                                        self.logger.warning(f"Could not remove original file: {e}")
-                                        # If we can't delete, try to move it instead
-                                        try:
-                                            failed_path = self._get_temp_file_path("failed_original")
-                                            shutil.move(file_path, failed_path)
-                                        except:
-                                            pass
-                                
-                                # Copy the repaired file to the original location
-                                shutil.copy2(repaired_path, file_path)
+                                # Move the repaired file over the original in one step
+                                if os.path.abspath(file_path) != os.path.abspath(repaired_path):
+                                    self._install_file(repaired_path, file_path)
                                 
                                 # Verify the final file
-                                if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
+                                if _file_size(file_path) > 0:
                                     self._update_status("Repair completed successfully")
                                     return True
                             except Exception as e:
@@ -987,7 +2312,7 @@ class ExcelProcessor:
                     self.logger.warning(f"{repair_method.__name__} failed: {method_error}")
             
             # If all repair methods failed, try to restore from backup
-            if backup_path and os.path.exists(backup_path) and os.path.getsize(backup_path) > 0:
+            if backup_path and _file_size(backup_path) > 0:
                 self._update_status("All repair methods failed. Attempting to restore from backup...")
                 try:
                     # Ensure target file is accessible
@@ -999,9 +2324,9 @@ class ExcelProcessor:
                             file_path = self._get_temp_file_path("restored")
                     
                     # Copy the backup
-                    shutil.copy2(backup_path, file_path)
+                    self._fast_copy(backup_path, file_path, keep_metadata=True)
                     
-                    if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
+                    if _file_size(file_path) > 0:
                         self._update_status("Successfully restored from backup")
                         return True
                 except Exception as restore_error:
@@ -1013,6 +2338,64 @@ class ExcelProcessor:
             self.logger.error(f"Repair process failed: {e}")
             return False
             
+    def _install_file(self, source_file: str, dest_file: str) -> None:
+        """
+        Replace a file with another, consuming the source.
+        
+        On the same device the source is renamed over the destination with
+        os.replace, which copies nothing and never leaves the destination
+        missing. Across devices the source is first copied next to the
+        destination and that copy is renamed into place.
+        
+        Args:
+            source_file: File to install, e.g. a repaired temp file
+            dest_file: File to replace
+        """
+        try:
+            same_device = (os.stat(os.path.dirname(os.path.abspath(source_file))).st_dev ==
+                           os.stat(os.path.dirname(os.path.abspath(dest_file))).st_dev)
+        except OSError:
+            same_device = False
+        
+        if same_device:
+            os.replace(source_file, dest_file)
+            return
+        
+        staged_file = f"{dest_file}.{uuid.uuid4().hex}.tmp"
+        try:
+            self._fast_copy(source_file, staged_file, keep_metadata=True)
+            os.replace(staged_file, dest_file)
+        except Exception:
+            if os.path.exists(staged_file):
+                os.unlink(staged_file)
+            raise
+        os.unlink(source_file)
+    
+    def _probe_file_lock(self, file_path: str) -> None:
+        """
+        Check that a file can be opened for writing and is not locked.
+        
+        Takes and releases a non-blocking lock on the file: msvcrt.locking on
+        Windows, fcntl.flock elsewhere.
+        
+        Args:
+            file_path: Path to the file to check
+            
+        Raises:
+            OSError: If the file cannot be opened or another process holds a lock on it
+        """
+        with open(file_path, 'rb+') as test_file:
+            fd = test_file.fileno()
+            if IS_WINDOWS:
+                import msvcrt
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                test_file.seek(0)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    
     def _validate_repaired_file(self, file_path: str) -> bool:
         """
         Validate a repaired Excel file to ensure it's usable.
@@ -1025,13 +2408,13 @@ class ExcelProcessor:
         """
         try:
             # Check if file exists and has size
-            if not os.path.exists(file_path) or os.path.getsize(file_path) == 0:
+            if _file_size(file_path) == 0:
                 return False
                 
             # Try opening with openpyxl in read-only mode
             if OPENPYXL_AVAILABLE:
                 try:
-                    wb = openpyxl.load_workbook(file_path, read_only=True)
+                    wb = openpyxl.load_workbook(file_path, read_only=True, keep_links=False)
                     sheet_count = len(wb.sheetnames)
                     wb.close()
                     self._update_status(f"Validated repaired file with {sheet_count} sheets")
@@ -1074,11 +2457,11 @@ class ExcelProcessor:
         repaired_path = self._get_temp_file_path("com_repaired")
         
         try:
-            # Ensure Excel is closed
-            self.close_excel_instances()
+            # Ensure Excel is closed, unless this repair already did so
+            if not self._excel_closed:
+                self.close_excel_instances()
             
-            # Initialize COM
-            pythoncom.CoInitialize()
+            self._init_com()
             
             # Start Excel with robust error handling
             try:
@@ -1135,10 +2518,10 @@ class ExcelProcessor:
             del excel
             wb = None
             excel = None
-            gc.collect()
+            self._release_com_objects()
             
             # Verify the repaired file
-            if os.path.exists(repaired_path) and os.path.getsize(repaired_path) > 0:
+            if _file_size(repaired_path) > 0:
                 self._update_status("Excel COM repair successful")
                 return True, repaired_path
                 
@@ -1165,13 +2548,7 @@ class ExcelProcessor:
                 del wb
             if excel:
                 del excel
-            gc.collect()
-            
-            # Uninitialize COM
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass
+            self._release_com_objects()
                 
     def _repair_with_pandas(self, file_path: str) -> tuple:
         """
@@ -1198,24 +2575,31 @@ class ExcelProcessor:
             # Create a new Excel writer
             writer = pd.ExcelWriter(repaired_path, engine='openpyxl')
             
-            # Process each sheet
-            for sheet_name in sheet_names:
+            # Read every sheet in one pass; only go sheet by sheet if that fails
+            try:
+                sheet_frames = excel_file.parse(sheet_name=None)
+            except Exception as batch_err:
+                self.logger.warning(f"Could not read all sheets at once, reading individually: {batch_err}")
+                sheet_frames = {}
+                for sheet_name in sheet_names:
+                    try:
+                        sheet_frames[sheet_name] = excel_file.parse(sheet_name)
+                    except Exception as sheet_err:
+                        self.logger.warning(f"Could not process sheet {sheet_name}: {sheet_err}")
+                        # Create an empty sheet instead
+                        sheet_frames[sheet_name] = pd.DataFrame()
+            
+            # Write each sheet
+            for sheet_name, df in sheet_frames.items():
                 self._update_status(f"Processing sheet: {sheet_name}")
-                # Read with error handling for individual sheets
-                try:
-                    df = pd.read_excel(file_path, sheet_name=sheet_name)
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
-                except Exception as sheet_err:
-                    self.logger.warning(f"Could not process sheet {sheet_name}: {sheet_err}")
-                    # Create an empty sheet instead
-                    df = pd.DataFrame()
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
+                df.to_excel(writer, sheet_name=sheet_name, index=False)
             
             # Save the writer
             writer.close()
+            excel_file.close()
             
             # Verify the repaired file
-            if os.path.exists(repaired_path) and os.path.getsize(repaired_path) > 0:
+            if _file_size(repaired_path) > 0:
                 self._update_status("Pandas repair successful")
                 return True, repaired_path
                 
@@ -1225,6 +2609,27 @@ class ExcelProcessor:
             self.logger.warning(f"Pandas repair failed: {e}")
             return False, None
             
+    def _opens_with_sheets(self, file_path: str) -> bool:
+        """
+        Check whether openpyxl can open a file in read-only mode and find sheets.
+        
+        Args:
+            file_path: Path to Excel file to check
+            
+        Returns:
+            bool: Whether the file opened and has at least one sheet
+        """
+        if not OPENPYXL_AVAILABLE:
+            return False
+        try:
+            wb = openpyxl.load_workbook(file_path, read_only=True, keep_links=False)
+            sheet_count = len(wb.sheetnames)
+            wb.close()
+            return sheet_count > 0
+        except Exception as e:
+            self.logger.debug(f"openpyxl could not open {file_path}: {e}")
+            return False
+    
     def _repair_with_openpyxl(self, file_path: str) -> tuple:
         """
         Repair Excel file using openpyxl.
@@ -1245,17 +2650,13 @@ class ExcelProcessor:
             
             # Try to read the workbook
             try:
-                wb = openpyxl.load_workbook(file_path, read_only=True)
+                wb = openpyxl.load_workbook(file_path, read_only=True, keep_links=False)
             except Exception as read_err:
                 self.logger.warning(f"Failed to open with openpyxl: {read_err}")
                 return False, None
                 
-            # Create a new workbook
-            new_wb = openpyxl.Workbook()
-            
-            # Remove default sheet
-            if "Sheet" in new_wb.sheetnames:
-                new_wb.remove(new_wb["Sheet"])
+            # Create a new write-only workbook (it has no default sheet)
+            new_wb = openpyxl.Workbook(write_only=True)
                 
             # Copy each sheet from source
             for sheet_name in wb.sheetnames:
@@ -1264,12 +2665,14 @@ class ExcelProcessor:
                 new_sheet = new_wb.create_sheet(title=sheet_name)
                 src_sheet = wb[sheet_name]
                 
+                # A missing stored dimension would truncate iter_rows to column A
+                self._ensure_sheet_dimensions(src_sheet)
+                
                 # Try to copy basic data
                 try:
-                    # Get rows from source sheet
-                    for row_idx, row in enumerate(src_sheet.iter_rows(values_only=True), 1):
-                        for col_idx, value in enumerate(row, 1):
-                            new_sheet.cell(row=row_idx, column=col_idx, value=value)
+                    # Stream rows from the source sheet straight into the new one
+                    for row in src_sheet.iter_rows(values_only=True):
+                        new_sheet.append(row)
                 except Exception as sheet_err:
                     self.logger.warning(f"Error copying sheet {sheet_name}: {sheet_err}")
             
@@ -1281,7 +2684,7 @@ class ExcelProcessor:
             new_wb.close()
             
             # Verify the repaired file
-            if os.path.exists(repaired_path) and os.path.getsize(repaired_path) > 0:
+            if _file_size(repaired_path) > 0:
                 self._update_status("Openpyxl repair successful")
                 return True, repaired_path
                 
@@ -1310,27 +2713,29 @@ class ExcelProcessor:
             self._update_status("Attempting system-based repair...")
             
             # First try to copy the file to a new location
-            shutil.copy2(file_path, repaired_path)
+            self._fast_copy(file_path, repaired_path)
             
             # Then try ExcelCnv command-line tool if available (on some Windows systems)
             try:
-                import subprocess
-                office_paths = [
-                    r"C:\Program Files\Microsoft Office\root\Office16",
-                    r"C:\Program Files (x86)\Microsoft Office\root\Office16",
-                    r"C:\Program Files\Microsoft Office\Office16",
-                    r"C:\Program Files (x86)\Microsoft Office\Office16",
-                    r"C:\Program Files\Microsoft Office\Office15",
-                    r"C:\Program Files (x86)\Microsoft Office\Office15",
-                ]
+                excelcnv_path = _EXCELCNV_PATH
+                
+                if excelcnv_path and self._validate_xlsx_structure(repaired_path):
+                    # The package itself is sound, so convert straight to XLSX
+                    self._update_status(f"Converting with Excel converter at: {excelcnv_path}")
+                    final_path = self._get_temp_file_path("final_repaired")
+                    subprocess.run([
+                        excelcnv_path,
+                        "-nme",  # No message boxes
+                        "-oice",  # Open Invalid with Converter Extensions
+                        "-xlsx",  # Convert to XLSX format
+                        repaired_path,
+                        final_path
+                    ], stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
+                    
+                    if _file_size(final_path) > 0:
+                        self._update_status("System repair successful")
+                        return True, final_path
                 
-                excelcnv_path = None
-                for office_path in office_paths:
-                    test_path = os.path.join(office_path, "excelcnv.exe")
-                    if os.path.exists(test_path):
-                        excelcnv_path = test_path
-                        break
-                        
                 if excelcnv_path:
                     self._update_status(f"Found Excel converter at: {excelcnv_path}")
                     
@@ -1345,10 +2750,10 @@ class ExcelProcessor:
                         "-xlsb",  # Convert to XLSB format first (more robust)
                         repaired_path,
                         output_path
-                    ], stderr=subprocess.PIPE, stdout=subprocess.PIPE)
+                    ], stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
                     
-                    # Convert back to xlsx
-                    if os.path.exists(output_path):
+                    # Convert back to xlsx; the temp path already exists, so only content counts
+                    if _file_size(output_path) > 0:
                         final_path = self._get_temp_file_path("final_repaired")
                         subprocess.run([
                             excelcnv_path,
@@ -1356,16 +2761,16 @@ class ExcelProcessor:
                             "-xlsx",  # Convert to XLSX format
                             output_path,
                             final_path
-                        ], stderr=subprocess.PIPE, stdout=subprocess.PIPE)
+                        ], stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
                         
-                        if os.path.exists(final_path) and os.path.getsize(final_path) > 0:
+                        if _file_size(final_path) > 0:
                             self._update_status("System repair successful")
                             return True, final_path
             except Exception as system_err:
                 self.logger.warning(f"System tool repair failed: {system_err}")
             
             # If system tools failed, return the simple copy if it exists
-            if os.path.exists(repaired_path) and os.path.getsize(repaired_path) > 0:
+            if _file_size(repaired_path) > 0:
                 return True, repaired_path
                 
             return False, None
@@ -1394,405 +2799,129 @@ class ExcelProcessor:
                 if success:
                     self._update_progress(90, "Direct library processing successful")
                     self._update_status(f"Successfully created and processed: {new_file}")
-                    if self.queue:
-                        self.queue.put(("success", f"File processed successfully. Output saved to: {new_file}"))
-                    return True
-                else:
-                    self._update_status("Direct library processing failed, falling back to basic copy...")
-            except Exception as e:
-                self.logger.warning(f"Direct library processing failed: {e}")
-                self._update_status("Falling back to basic file copy...")
-            
-            # Very simple fallback - just make a copy
-            try:
-                self._update_progress(10, f"Creating new workbook at {new_file}...")
-                shutil.copy2(original_file, new_file)
-                
-                self._update_progress(100, "Processing complete (basic copy only)")
-                self._update_status(f"Successfully created copy: {new_file}")
-                if self.queue:
-                    self.queue.put(("success", f"File copied successfully. Output saved to: {new_file}"))
-                return True
-            except Exception as e:
-                self.logger.error(f"Basic copy failed: {str(e)}", exc_info=True)
-                if self.queue:
-                    self.queue.put(("error", f"Processing failed: {str(e)}"))
-                return False
-                
-        except Exception as e:
-            self.logger.error("Processing failed", exc_info=True)
-            if self.queue:
-                self.queue.put(("error", str(e)))
-            return False
-    
-    def _direct_file_copy(self, source_file: str, dest_file: str) -> bool:
-        """
-        Perform a direct file copy without using COM.
-        This is more reliable when COM operations fail.
-        
-        Args:
-            source_file: Source file path
-            dest_file: Destination file path
-            
-        Returns:
-            bool: Whether the copy was successful
-        """
-        try:
-            self._update_status(f"Directly copying file from {source_file} to {dest_file}...")
-            
-            # Ensure the destination directory exists
-            os.makedirs(os.path.dirname(dest_file), exist_ok=True)
-            
-            # Make sure we can access the source file
-            max_retries = 5
-            retry_count = 0
-            file_accessible = False
-            
-            while retry_count < max_retries and not file_accessible:
-                try:
-                    # Test if we can read the source file
-                    with open(source_file, 'rb') as test_file:
-                        test_file.read(1)  # Try to read a byte
-                    file_accessible = True
-                except Exception as e:
-                    retry_count += 1
-                    self.logger.warning(f"Source file access retry {retry_count}/{max_retries}: {e}")
-                    
-                    # Try to release the file by forcing garbage collection
-                    gc.collect()
-                    time.sleep(2)  # Wait before retrying
-                    
-                    # Make sure Excel is closed
-                    if retry_count >= 2:
-                        self.close_excel_instances()
-            
-            if not file_accessible:
-                self.logger.error("Could not access source file for copying")
-                return False
-            
-            # Check for destination file accessibility
-            if os.path.exists(dest_file):
-                try:
-                    # Try to remove existing dest file if it might be locked
-                    with open(dest_file, 'r+b') as test_file:
-                        test_file.seek(0)
-                except Exception as e:
-                    self.logger.warning(f"Destination file is locked, trying to use a different path: {e}")
-                    # Use a new destination path
-                    old_dest = dest_file
-                    dest_file = self._get_temp_file_path("direct_copy")
-                    self._update_status(f"Using alternative path: {dest_file}")
-            
-            # Try several copy methods
-            copy_methods = [
-                # Method 1: Standard shutil.copy2
-                lambda s, d: shutil.copy2(s, d),
-                
-                # Method 2: Low-level file copy with chunks
-                lambda s, d: self._chunk_copy(s, d),
-                
-                # Method 3: Use system commands (Windows)
-                lambda s, d: self._system_copy(s, d) if IS_WINDOWS else None,
-                
-                # Method 4: os.system copy (fallback)
-                lambda s, d: os.system(f'copy "{s}" "{d}"') if IS_WINDOWS else None
-            ]
-            
-            # Try each copy method until one succeeds
-            success = False
-            for method_idx, copy_method in enumerate(copy_methods):
-                try:
-                    self._update_status(f"Trying copy method {method_idx+1}...")
-                    result = copy_method(source_file, dest_file)
-                    if result is not None and result != 0:
-                        continue  # Try next method if this one returned an error code
-                    
-                    # Verify the copy succeeded
-                    if os.path.exists(dest_file) and os.path.getsize(dest_file) > 0:
-                        file_size = os.path.getsize(dest_file)
-                        self._update_status(f"Direct file copy successful ({file_size} bytes)")
-                        success = True
-                        break
-                except Exception as e:
-                    self.logger.warning(f"Copy method {method_idx+1} failed: {e}")
-                    continue
-            
-            if not success:
-                self.logger.error("All copy methods failed")
-                return False
-                
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Error during direct file copy: {str(e)}", exc_info=True)
-            return False
-            
-    def _chunk_copy(self, source_file: str, dest_file: str) -> bool:
-        """
-        Copy a file in chunks to avoid memory issues with large files.
-        
-        Args:
-            source_file: Source file path
-            dest_file: Destination file path
-            
-        Returns:
-            bool: Whether the copy was successful
-        """
-        try:
-            # Use a larger buffer for faster copying of large files
-            buffer_size = 10 * 1024 * 1024  # 10MB buffer
-            
-            with open(source_file, 'rb') as src, open(dest_file, 'wb') as dst:
-                while True:
-                    chunk = src.read(buffer_size)
-                    if not chunk:
-                        break
-                    dst.write(chunk)
-            
-            return True
-        except Exception as e:
-            self.logger.warning(f"Chunk copy failed: {e}")
-            return False
-    
-    def _system_copy(self, source_file: str, dest_file: str) -> int:
-        """
-        Use system-specific copy commands for reliability.
-        
-        Args:
-            source_file: Source file path
-            dest_file: Destination file path
-            
-        Returns:
-            int: Return code (0 for success)
-        """
-        if IS_WINDOWS:
-            # Windows - use robocopy or xcopy
-            try:
-                import subprocess
-                # Try robocopy first (more reliable for locked files)
-                source_dir = os.path.dirname(source_file)
-                source_file_name = os.path.basename(source_file)
-                dest_dir = os.path.dirname(dest_file)
-                
-                # Use /R:3 to retry 3 times if file is locked, /W:2 to wait 2 seconds between retries
-                # /J for unbuffered I/O, /B for backup mode (can copy open files), /NP for no progress
-                result = subprocess.run(
-                    ['robocopy', source_dir, dest_dir, source_file_name, '/R:3', '/W:2', '/J', '/B', '/NP'],
-                    capture_output=True,
-                    text=True
-                )
-                
-                # Robocopy return codes: 0 = no files copied, 1 = files copied, > 1 = errors
-                if result.returncode <= 1:
-                    return 0  # Success
-                
-                # If robocopy failed, try xcopy
-                result = subprocess.run(
-                    ['xcopy', source_file, dest_file, '/Y', '/Q', '/R', '/H'],
-                    capture_output=True,
-                    text=True
-                )
-                
-                return result.returncode
-            except Exception as e:
-                self.logger.warning(f"System copy failed: {e}")
-                return 1
-        else:
-            # Unix-like - use cp
-            try:
-                import subprocess
-                result = subprocess.run(['cp', source_file, dest_file], capture_output=True, text=True)
-                return result.returncode
-            except Exception as e:
-                self.logger.warning(f"System cp failed: {e}")
-                return 1
-    
-    def _create_clean_copy(self, original_file: str, new_file: str) -> bool:
-        """
-        Create a clean copy of the original file using COM if possible.
-        
-        Args:
-            original_file: Original file path
-            new_file: New file path
-            
-        Returns:
-            bool: Whether the operation was successful
-        """
-        try:
-            # First make sure the output directory exists
-            os.makedirs(os.path.dirname(new_file), exist_ok=True)
-            
-            # Create a temporary file for intermediate processing
-            temp_file = self._get_temp_file_path("init_copy")
-            
-            # Try opening the original file to verify its integrity
-            self._update_status("Verifying original file integrity...")
-            
-            # Use COM if available
-            if WINDOWS_COM_AVAILABLE and IS_WINDOWS:
-                try:
-                    # Initialize COM
-                    pythoncom.CoInitialize()
-                    
-                    # Start Excel
-                    excel = win32com.client.Dispatch("Excel.Application")
-                    excel.Visible = False
-                    excel.DisplayAlerts = False
-                    
-                    # Open workbook with recovery options
-                    wb = excel.Workbooks.Open(
-                        original_file,
-                        UpdateLinks=0,
-                        ReadOnly=True,
-                        CorruptLoad=2  # xlRepairFile (better corruption handling)
-                    )
-                    
-                    # Save as a new clean file
-                    wb.SaveAs(
-                        temp_file,
-                        FileFormat=51,  # xlOpenXMLWorkbook
-                        CreateBackup=False
-                    )
-                    
-                    # Clean close
-                    wb.Close(SaveChanges=False)
-                    excel.Quit()
-                    
-                    # Force cleanup
-                    del wb
-                    del excel
-                    gc.collect()
-                    pythoncom.CoUninitialize()
-                    
-                    # Verify file exists and has content
-                    if not os.path.exists(temp_file) or os.path.getsize(temp_file) == 0:
-                        raise ValueError("Failed to create valid copy")
-                    
-                    # Copy the temp file to the final destination
-                    shutil.copy2(temp_file, new_file)
-                    
-                    # Clean external connections
-                    try:
-                        from ..modules.excel_cleaner import clean_excel_external_data
-                        clean_excel_external_data(new_file, self.logger)
-                    except ImportError:
-                        # Try inline cleaning if module is not available
-                        if WINDOWS_COM_AVAILABLE and IS_WINDOWS:
-                            self._clean_external_connections(new_file)
-                    
+                    if self.queue:
+                        self.queue.put(("success", f"File processed successfully. Output saved to: {new_file}"))
                     return True
-                    
-                except Exception as e:
-                    self.logger.warning(f"COM copy failed: {e}, falling back to direct copy")
+                else:
+                    self._update_status("Direct library processing failed, falling back to basic copy...")
+            except Exception as e:
+                self.logger.warning(f"Direct library processing failed: {e}")
+                self._update_status("Falling back to basic file copy...")
             
-            # Direct copy as fallback
-            if self._direct_file_copy(original_file, new_file):
-                self._update_status("Created copy successfully using direct file copy")
+            # Very simple fallback - just make a copy
+            try:
+                self._update_progress(10, f"Creating new workbook at {new_file}...")
+                shutil.copy2(original_file, new_file)
+                
+                self._update_progress(100, "Processing complete (basic copy only)")
+                self._update_status(f"Successfully created copy: {new_file}")
+                if self.queue:
+                    self.queue.put(("success", f"File copied successfully. Output saved to: {new_file}"))
                 return True
-            else:
-                self.logger.error("Failed to create copy")
+            except Exception as e:
+                self.logger.error(f"Basic copy failed: {str(e)}", exc_info=True)
+                if self.queue:
+                    self.queue.put(("error", f"Processing failed: {str(e)}"))
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Error during clean copy creation: {str(e)}")
+            self.logger.error("Processing failed", exc_info=True)
+            if self.queue:
+                self.queue.put(("error", str(e)))
             return False
     
-    def _clean_external_connections(self, file_path: str) -> bool:
+    def _fast_copy(self, source_file: str, dest_file: str, keep_metadata: bool = False) -> None:
         """
-        Clean external connections in the Excel file to prevent security issues.
+        Copy a file's contents using the operating system's copy path.
+        
+        On Windows the copy is handed to CopyFileExW; elsewhere
+        os.copy_file_range or os.sendfile moves the bytes inside the kernel.
+        Either way no buffer passes through Python. If the native call is unavailable or fails, shutil.copyfile is
+        used, which raises on failure.
         
         Args:
-            file_path: Path to Excel file
-            
-        Returns:
-            bool: Whether the cleaning was successful
+            source_file: Source file path
+            dest_file: Destination file path
+            keep_metadata: Also copy timestamps and permission bits, like shutil.copy2
         """
-        if not WINDOWS_COM_AVAILABLE or not IS_WINDOWS:
-            return False
-            
-        excel = None
-        wb = None
+        self._copy_contents(source_file, dest_file)
+        if keep_metadata:
+            shutil.copystat(source_file, dest_file)
+    
+    def _clone_file(self, source_file: str, dest_file: str) -> None:
+        """
+        Copy a file as a copy-on-write clone where the filesystem supports it.
         
+        A clone shares the source's data blocks until either file is written,
+        so it costs the same for any file size and stays independent of the
+        source. Linux uses the FICLONE ioctl and macOS uses clonefile();
+        anywhere else, or when the filesystem cannot clone, this falls back
+        to _fast_copy. Timestamps and permission bits are always copied.
+        
+        Args:
+            source_file: Source file path
+            dest_file: Destination file path
+        """
         try:
-            # Initialize COM
-            pythoncom.CoInitialize()
-            
-            # Start Excel with limited automation security
-            excel = win32com.client.Dispatch("Excel.Application")
-            excel.Visible = False
-            excel.DisplayAlerts = False
-            
-            # Open workbook
-            wb = excel.Workbooks.Open(
-                file_path,
-                UpdateLinks=0,
-                ReadOnly=False
-            )
-            
-            # Break all external links
+            if sys.platform.startswith('linux'):
+                import fcntl
+                with open(source_file, 'rb') as src, open(dest_file, 'wb') as dst:
+                    fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                shutil.copystat(source_file, dest_file)
+                return
+            if sys.platform == 'darwin':
+                libc = ctypes.CDLL(None, use_errno=True)
+                if libc.clonefile(os.fsencode(source_file), os.fsencode(dest_file), 0) == 0:
+                    return
+                self.logger.debug(f"clonefile failed with errno {ctypes.get_errno()}")
+        except OSError as e:
+            self.logger.debug(f"Copy-on-write clone not supported here: {e}")
+        
+        self._fast_copy(source_file, dest_file, keep_metadata=True)
+    
+    def _copy_contents(self, source_file: str, dest_file: str) -> None:
+        """
+        Copy a file's contents for _fast_copy.
+        
+        Args:
+            source_file: Source file path
+            dest_file: Destination file path
+        """
+        if IS_WINDOWS:
             try:
-                # Excel constants for link types
-                xlExcelLinks = 1
-                xlOLELinks = 2
-                xlPublishers = 5
-                xlTextImport = 6
-                
-                for link_type in [xlExcelLinks, xlOLELinks, xlPublishers, xlTextImport]:
-                    try:
-                        wb.BreakLink(Name="", Type=link_type)
-                    except:
-                        pass
-            except:
-                pass
-            
-            # Remove any data connections
-            if hasattr(wb, 'Connections'):
-                try:
-                    for i in range(wb.Connections.Count, 0, -1):
-                        try:
-                            wb.Connections(i).Delete()
-                        except:
-                            pass
-                except:
-                    pass
-            
-            # Save the workbook
-            wb.Save()
-            
-            # Close properly
-            wb.Close(SaveChanges=False)
-            excel.Quit()
-            
-            return True
-            
-        except Exception as e:
-            self.logger.warning(f"External connection cleanup failed: {e}")
-            return False
-        finally:
-            # Cleanup
-            if wb:
-                try:
-                    wb.Close(SaveChanges=False)
-                except:
-                    pass
-            
-            if excel:
+                if ctypes.windll.kernel32.CopyFileExW(source_file, dest_file, None, None, None, 0):
+                    return
+                self.logger.debug(f"CopyFileExW failed with error {ctypes.GetLastError()}")
+            except Exception as e:
+                self.logger.debug(f"CopyFileExW unavailable: {e}")
+        else:
+            # copy_file_range lets the filesystem share extents or copy server-side (NFS, SMB);
+            # sendfile still moves the bytes in the kernel where it is not supported
+            kernel_copies = []
+            if hasattr(os, "copy_file_range"):
+                kernel_copies.append(("copy_file_range", lambda src_fd, dst_fd, offset, count:
+                                      os.copy_file_range(src_fd, dst_fd, count, offset, offset)))
+            if hasattr(os, "sendfile"):
+                kernel_copies.append(("sendfile", lambda src_fd, dst_fd, offset, count:
+                                      os.sendfile(dst_fd, src_fd, offset, count)))
+            
+            for name, kernel_copy in kernel_copies:
                 try:
-                    excel.Quit()
-                except:
-                    pass
-            
-            # Force cleanup of COM objects
-            if wb:
-                del wb
-            if excel:
-                del excel
-            gc.collect()
-            
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass
+                    with open(source_file, 'rb') as src, open(dest_file, 'wb') as dst:
+                        size = os.fstat(src.fileno()).st_size
+                        offset = 0
+                        while offset < size:
+                            sent = kernel_copy(src.fileno(), dst.fileno(), offset, size - offset)
+                            if sent == 0:
+                                break
+                            offset += sent
+                    if offset == size:
+                        return
+                    self.logger.debug(f"{name} stopped after {offset} of {size} bytes")
+                except OSError as e:
+                    self.logger.debug(f"{name} copy failed: {e}")
+        
+        shutil.copyfile(source_file, dest_file)
     
     def _process_with_libraries(self, original_file: str, output_file: str, password: str) -> bool:
         """
@@ -1816,12 +2945,9 @@ class ExcelProcessor:
             # Create output directory if needed
             os.makedirs(os.path.dirname(output_file), exist_ok=True)
             
-            # Copy the file first for safety
-            self._direct_file_copy(original_file, output_file)
-            
-            # Load workbook with openpyxl
+            # Load the original directly; saving writes the output, so no copy is needed first
             self._update_status("Loading workbook with openpyxl...")
-            wb = openpyxl.load_workbook(output_file, data_only=True)
+            wb = openpyxl.load_workbook(original_file, data_only=True)
             
             if self.sheet_name not in wb.sheetnames:
                 self.logger.warning(f"Required sheet '{self.sheet_name}' not found")
@@ -1900,16 +3026,16 @@ class ExcelProcessor:
         Returns:
             Dict[str, int]: Mapping of header names to column indexes
         """
-        column_indexes = {}
-        
-        # Set up default headers if not already specified
-        headers_to_find = getattr(self, 'headers_to_find', DEFAULT_HEADERS_TO_FIND)
-        header_row = getattr(self, 'header_row', DEFAULT_HEADER_ROW)
+        headers_to_find = self.headers_to_find
+        header_row = self.header_row
         
-        # Find all headers
-        for cell in sheet[header_row]:
-            if cell.value in headers_to_find:
-                column_indexes[cell.value] = cell.column
+        # Read only the header row's values
+        row = next(sheet.iter_rows(min_row=header_row, max_row=header_row, values_only=True), ())
+        column_indexes = {
+            value: col_idx
+            for col_idx, value in enumerate(row, start=1)
+            if value in headers_to_find
+        }
                 
         # Check if we found all required headers
         if len(column_indexes) < len(headers_to_find):
@@ -1927,7 +3053,7 @@ class ExcelProcessor:
         Returns:
             str: RGB color value
         """
-        header_row = getattr(self, 'header_row', DEFAULT_HEADER_ROW)
+        header_row = self.header_row
         header_cell = sheet.cell(row=header_row, column=1)
         
         # Default to white if no fill
@@ -1963,42 +3089,68 @@ class ExcelProcessor:
         Returns:
             int: Matching row number
         """
-        header_row = getattr(self, 'header_row', DEFAULT_HEADER_ROW)
+        header_row = self.header_row
         
-        for row in sheet.iter_rows(min_row=header_row + 1):
+        # Colour match per distinct style, so each style's fill is read once
+        style_matches = {}
+        
+        # Only column A is needed
+        for row in sheet.iter_rows(min_row=header_row + 1, max_col=1):
+            if not row:
+                continue
             cell = row[0]
             
-            # Skip cells without fill
-            if not hasattr(cell, 'fill') or not cell.fill:
+            # Read-only sheets pad missing cells with a placeholder that has no fill
+            if cell is EMPTY_CELL:
                 continue
-                
-            # Get cell fill color
-            cell_fill_color = getattr(cell.fill.start_color, 'index', None)
             
-            # Skip cells without fill color
-            if not cell_fill_color:
-                continue
-                
-            # Convert to RGB
-            if isinstance(cell_fill_color, int):
-                cell_fill_color = f"{cell_fill_color:06X}"
-                
-            # Handle color index
-            cell_rgb_color = cell_fill_color
-            if hasattr(COLOR_INDEX, '__contains__') and int(cell_fill_color, 16) in COLOR_INDEX:
-                cell_rgb_color = COLOR_INDEX[int(cell_fill_color, 16)]
-                
-            # Clean up color format
-            if isinstance(cell_rgb_color, str) and len(cell_rgb_color) == 8 and cell_rgb_color.startswith('FF'):
-                cell_rgb_color = cell_rgb_color[2:]
-                
-            # Compare colors
-            if cell_rgb_color == rgb_color:
+            style_key = _style_key(cell)
+            matches = style_matches.get(style_key)
+            if matches is None:
+                matches = style_matches[style_key] = self._cell_fill_rgb(cell) == rgb_color
+            
+            if matches:
                 return cell.row
                 
         # If no matching row found, return max row
         return sheet.max_row
     
+    def _cell_fill_rgb(self, cell) -> Optional[str]:
+        """
+        Get a cell's fill colour in the form _process_header_formatting returns.
+        
+        Args:
+            cell: Worksheet cell
+            
+        Returns:
+            Optional[str]: RGB color value, or None if the cell has no fill color
+        """
+        # Skip cells without fill
+        if not hasattr(cell, 'fill') or not cell.fill:
+            return None
+            
+        # Get cell fill color
+        cell_fill_color = getattr(cell.fill.start_color, 'index', None)
+        
+        # Skip cells without fill color
+        if not cell_fill_color:
+            return None
+            
+        # Convert to RGB
+        if isinstance(cell_fill_color, int):
+            cell_fill_color = f"{cell_fill_color:06X}"
+            
+        # Handle color index
+        cell_rgb_color = cell_fill_color
+        if hasattr(COLOR_INDEX, '__contains__') and int(cell_fill_color, 16) in COLOR_INDEX:
+            cell_rgb_color = COLOR_INDEX[int(cell_fill_color, 16)]
+            
+        # Clean up color format
+        if isinstance(cell_rgb_color, str) and len(cell_rgb_color) == 8 and cell_rgb_color.startswith('FF'):
+            cell_rgb_color = cell_rgb_color[2:]
+            
+        return cell_rgb_color
+    
     def _add_do_comments_column(self, sheet) -> None:
         """
         Add and format DO Comments column.
@@ -2007,33 +3159,295 @@ class ExcelProcessor:
             sheet: Worksheet to process
         """
         last_col = sheet.max_column
-        header_row = getattr(self, 'header_row', DEFAULT_HEADER_ROW)
+        header_row = self.header_row
         
         # Create the header cell
         new_header_cell = sheet.cell(row=header_row, column=last_col + 1)
         new_header_cell.value = "DO Comments"
+        self._style_do_comments_header(new_header_cell)
+        
+        # Set column width
+        col_letter = get_column_letter(last_col + 1)
+        sheet.column_dimensions[col_letter].width = 25
         
+        # Log the successful addition of DO Comments column
+        self.logger.info(f"Added DO Comments column at position {last_col + 1} (column {col_letter})")
+    
+    def _style_do_comments_header(self, header_cell) -> None:
+        """
+        Format the DO Comments header cell.
+        
+        Args:
+            header_cell: Header cell to format
+        """
         # Format the header cell with explicit colors (no Color objects)
-        new_header_cell.fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
-        new_header_cell.font = Font(color="FF0000", bold=True, size=11, name="Calibri")
-        new_header_cell.border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        new_header_cell.alignment = Alignment(
+        header_cell.fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
+        header_cell.font = Font(color="FF0000", bold=True, size=11, name="Calibri")
+        header_cell.border = _THIN_BORDER
+        header_cell.alignment = Alignment(
             horizontal='center',
             vertical='center',
             wrap_text=True
         )
+    
+    def _iter_classified_rows(self, sheet, column_indexes: Dict[str, int], rgb_color: str, max_col: int):
+        """
+        Stream a sheet's rows together with their DO Comments code.
         
-        # Set column width
-        col_letter = get_column_letter(last_col + 1)
-        sheet.column_dimensions[col_letter].width = 25
+        The rows after the header are classified up to the first row whose
+        column A fill matches the header colour, the same rows that
+        _find_matching_row and _classify_sheet_rows select, but found while
+        the sheet is read once. Rows are held back at most STREAM_CLASSIFY_ROWS
+        at a time until they are classified, so each comment is yielded with
+        its row. Batches that small are classified in-process; a process pool
+        would cost more to start than it saves.
         
-        # Log the successful addition of DO Comments column
-        self.logger.info(f"Added DO Comments column at position {last_col + 1} (column {col_letter})")
+        Args:
+            sheet: Source worksheet
+            column_indexes: Column index mapping
+            rgb_color: Header fill colour that marks the end of the rows to process
+            max_col: Last column to read
+            
+        Yields:
+            tuple: (row number, source cells, COMMENT_* code or None if the row gets no comment)
+        """
+        header_row = self.header_row
+        max_row = sheet.max_row
+        
+        # Check if we have required columns
+        required_columns = ["Difference", "Include in CFO Cert Letter", "Explanation"]
+        missing_columns = [col for col in required_columns if col not in column_indexes]
+        if missing_columns:
+            self.logger.warning(f"Missing required columns: {missing_columns}")
+        
+        # Zero-based positions of the input columns, or None once nothing is classified
+        offsets = None if missing_columns else tuple(column_indexes[col] - 1 for col in required_columns)
+        
+        style_matches = {}
+        pending = []
+        code_chunks = []
+        invalid_count = 0
+        matching_row = None
+        
+        def classified(rows):
+            nonlocal offsets, invalid_count
+            if offsets is not None:
+                try:
+                    values = [
+                        [row[offset].value if offset < len(row) else None for _, row in rows]
+                        for offset in offsets
+                    ]
+                    codes, invalid_rows = _classify_do_comments(*values)
+                    code_chunks.append(codes)
+                    invalid_count += len(invalid_rows)
+                    return [(row_idx, row, int(code)) for (row_idx, row), code in zip(rows, codes)]
+                except Exception as e:
+                    self.logger.error(f"Error processing DO Comments (row {rows[0][0]}): {e}", exc_info=True)
+                    self._update_status(f"DO Comments processing stopped at row {rows[0][0]}: {e}")
+                    offsets = None
+            return [(row_idx, row, None) for row_idx, row in rows]
+        
+        row_idx = 0
+        for row_idx, row in enumerate(sheet.iter_rows(min_row=1, max_row=max_row, max_col=max_col), start=1):
+            if offsets is None or matching_row is not None or row_idx <= header_row:
+                yield row_idx, row, None
+                continue
+            
+            # Read-only sheets pad missing cells with a placeholder that has no fill
+            cell = row[0] if row else EMPTY_CELL
+            if cell is not EMPTY_CELL:
+                style_key = _style_key(cell)
+                matches = style_matches.get(style_key)
+                if matches is None:
+                    matches = style_matches[style_key] = self._cell_fill_rgb(cell) == rgb_color
+                if matches:
+                    matching_row = row_idx
+                    yield from classified(pending)
+                    pending = []
+                    yield row_idx, row, None
+                    continue
+            
+            if len(pending) >= STREAM_CLASSIFY_ROWS:
+                yield from classified(pending)
+                pending = []
+            pending.append((row_idx, row))
+        
+        # Without a matching row the sheet's last row ends the processed rows
+        if pending and matching_row is None and pending[-1][0] == max_row:
+            last_idx, last = pending.pop()
+            yield from classified(pending)
+            yield last_idx, last, None
+        elif pending:
+            yield from classified(pending)
+        
+        # A stored dimension can reach far past the last row in the sheet; those
+        # rows are all empty, so padding stops at the header if it lies beyond the data
+        if row_idx < max_row:
+            self.logger.info(f"Sheet dimension ends at row {max_row}, but the last stored row is {row_idx}")
+        for row_idx in range(row_idx + 1, header_row + 1):
+            yield row_idx, (), None
+        
+        if offsets is None:
+            return
+        
+        self.logger.info(f"Processed rows from {header_row + 1} to {matching_row or max_row}")
+        if invalid_count:
+            self._update_status(f"{invalid_count} rows have a non-numeric Difference and were treated as zero")
+        if NUMPY_AVAILABLE:
+            self._report_do_comments(np.concatenate(code_chunks) if code_chunks else ())
+        else:
+            self._report_do_comments([code for codes in code_chunks for code in codes])
+    
+    def _classify_sheet_rows(self, sheet, column_indexes: Dict[str, int], matching_row: int):
+        """
+        Read the DO Comments input columns and classify each row.
+        
+        Args:
+            sheet: Worksheet holding the data
+            column_indexes: Column index mapping
+            matching_row: Last row to process
+            
+        Returns:
+            tuple: (row numbers, COMMENT_* code per row), or None if required columns are missing
+        """
+        header_row = self.header_row
+        
+        # Check if we have required columns
+        required_columns = ["Difference", "Include in CFO Cert Letter", "Explanation"]
+        missing_columns = [col for col in required_columns if col not in column_indexes]
+        
+        if missing_columns:
+            self.logger.warning(f"Missing required columns: {missing_columns}")
+            return None
+        
+        self.logger.info(f"Processing rows from {header_row + 1} to {matching_row}")
+        
+        # Resolve the column numbers once, outside the row loops
+        columns = (
+            column_indexes["Difference"],
+            column_indexes["Include in CFO Cert Letter"],
+            column_indexes["Explanation"],
+        )
+        
+        # Read and classify the input columns a chunk of rows at a time; only
+        # the comment codes are kept between chunks
+        rows = range(header_row + 1, matching_row)
+        code_chunks = []
+        invalid_count = 0
+        
+        # One pool serves every chunk of the sheet
+        processes = self.classify_processes or os.cpu_count() or 1
+        pool = _classify_pool(len(rows), processes)
+        try:
+            for differences, include_cfo_values, explanations in _iter_column_chunks(sheet, rows.start, rows.stop - 1, columns):
+                chunk_codes, invalid_rows = _classify_do_comments_parallel(
+                    differences, include_cfo_values, explanations, processes=processes, pool=pool
+                )
+                code_chunks.append(chunk_codes)
+                invalid_count += len(invalid_rows)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        
+        if NUMPY_AVAILABLE:
+            comment_codes = np.concatenate(code_chunks) if code_chunks else np.zeros(0, dtype=np.int8)
+        else:
+            comment_codes = [code for chunk_codes in code_chunks for code in chunk_codes]
+        
+        if invalid_count:
+            self._update_status(f"{invalid_count} rows have a non-numeric Difference and were treated as zero")
+        
+        return rows, comment_codes
+    
+    def _report_do_comments(self, comment_codes) -> None:
+        """
+        Log a summary of the DO Comments that were written.
+        
+        Args:
+            comment_codes: COMMENT_* code per processed row
+        """
+        # Count the comments in each category
+        if NUMPY_AVAILABLE:
+            counts = np.bincount(np.asarray(comment_codes, dtype=np.intp), minlength=len(DO_COMMENT_TEXT)).tolist()
+        else:
+            counts = [0] * len(DO_COMMENT_TEXT)
+            for comment_code in comment_codes:
+                counts[comment_code] += 1
+        explanation_reasonable_count = counts[COMMENT_REASONABLE]
+        include_in_cfo_count = counts[COMMENT_INCLUDE_CFO]
+        explanation_required_count = counts[COMMENT_REQUIRED]
+        
+        processed_count = explanation_reasonable_count + include_in_cfo_count + explanation_required_count
+        self.logger.info(f"DO Comments summary: {explanation_reasonable_count} Explanation Reasonable, "
+                         f"{include_in_cfo_count} Include in CFO, {explanation_required_count} Explanation Required")
+        self._update_status(f"Successfully processed {processed_count} rows with DO Comments")
+    
+    def _apply_comment_styles(self, comment_cells: List[Any], comment_codes) -> None:
+        """
+        Apply the DO Comments named styles to a column of comment cells.
+        
+        The named style is resolved once per style and the other cells get a
+        copy of its style array. They cannot share one, because openpyxl
+        updates a cell's style array in place when its formatting changes.
+        Highlighted rows are written as runs of consecutive rows, since rows
+        needing an explanation tend to cluster.
+        
+        Args:
+            comment_cells: Comment cells, one per classified row
+            comment_codes: COMMENT_* code per row
+        """
+        if not comment_cells:
+            return
+        
+        # Every comment cell wraps; resolve the style on the first cell and copy it to the rest
+        first_cell = comment_cells[0]
+        first_cell.style = COMMENT_STYLE_WRAP
+        wrap_style = first_cell._style
+        for comment_cell in comment_cells[1:]:
+            comment_cell._style = copy(wrap_style)
+        
+        # Highlight cells that require attention, one run of rows at a time
+        if NUMPY_AVAILABLE:
+            required_offsets = np.flatnonzero(np.asarray(comment_codes) == COMMENT_REQUIRED)
+        else:
+            required_offsets = [offset for offset, code in enumerate(comment_codes) if code == COMMENT_REQUIRED]
+        
+        runs = _contiguous_runs(required_offsets)
+        if not runs:
+            return
+        
+        first_required = comment_cells[runs[0][0]]
+        first_required.style = COMMENT_STYLE_REQUIRED
+        required_style = first_required._style
+        for start, end in runs:
+            for comment_cell in comment_cells[start:end + 1]:
+                comment_cell._style = copy(required_style)
+    
+    def _ensure_comment_styles(self, workbook) -> None:
+        """
+        Register the DO Comments named styles on a workbook.
+        
+        Comment cells then share one style record each instead of carrying
+        their own alignment, border and fill objects.
+        
+        Args:
+            workbook: openpyxl workbook
+        """
+        if COMMENT_STYLE_WRAP not in workbook.named_styles:
+            wrap_style = NamedStyle(name=COMMENT_STYLE_WRAP)
+            wrap_style.font = DEFAULT_FONT
+            wrap_style.alignment = _WRAP_ALIGN
+            wrap_style.border = _THIN_BORDER
+            workbook.add_named_style(wrap_style)
+        
+        if COMMENT_STYLE_REQUIRED not in workbook.named_styles:
+            required_style = NamedStyle(name=COMMENT_STYLE_REQUIRED)
+            required_style.font = DEFAULT_FONT
+            required_style.alignment = _WRAP_ALIGN
+            required_style.border = _THIN_BORDER
+            required_style.fill = _RED_FILL
+            workbook.add_named_style(required_style)
     
     def _process_rows_with_openpyxl(self, sheet, column_indexes: Dict[str, int], matching_row: int) -> None:
         """
@@ -2047,8 +3461,7 @@ class ExcelProcessor:
         # Get the last column - this should be the DO Comments column we added
         last_col = sheet.max_column
         comment_col = last_col
-        processed_count = 0
-        header_row = getattr(self, 'header_row', DEFAULT_HEADER_ROW)
+        header_row = self.header_row
         
         # Verify DO Comments column exists, if not add it now
         header_cell = sheet.cell(row=header_row, column=comment_col)
@@ -2057,92 +3470,70 @@ class ExcelProcessor:
             self._add_do_comments_column(sheet)
             # Update the comment column pointer to the newly added column
             comment_col = sheet.max_column
-            
-        # Check if we have required columns
-        required_columns = ["Difference", "Include in CFO Cert Letter", "Explanation"]
-        missing_columns = [col for col in required_columns if col not in column_indexes]
         
-        if missing_columns:
-            self.logger.warning(f"Missing required columns: {missing_columns}")
-            return
+        try:
+            classified = self._classify_sheet_rows(sheet, column_indexes, matching_row)
+            if classified is None:
+                return
             
-        self.logger.info(f"Processing rows from {header_row + 1} to {matching_row} with DO Comments in column {comment_col}")
-        
-        # Track the number of comments in each category
-        explanation_reasonable_count = 0
-        include_in_cfo_count = 0
-        explanation_required_count = 0
+            rows, comment_codes = classified
+            self._ensure_comment_styles(sheet.parent)
             
-        for row in range(header_row + 1, matching_row):
-            try:
-                # Get the cells for required columns
-                difference_cell = sheet.cell(row=row, column=column_indexes["Difference"])
-                include_cfo_cell = sheet.cell(row=row, column=column_indexes["Include in CFO Cert Letter"])
-                explanation_cell = sheet.cell(row=row, column=column_indexes["Explanation"])
-                
-                # Extract values, ensuring we normalize to appropriate types
-                try:
-                    difference_value = float(difference_cell.value) if difference_cell.value not in (None, "") else 0
-                except (ValueError, TypeError):
-                    difference_value = 0
-                    
-                include_cfo_value = str(include_cfo_cell.value).upper() if include_cfo_cell.value is not None else ""
-                explanation_value = explanation_cell.value
-                
-                # Prepare the comment cell
-                comment_cell = sheet.cell(row=row, column=comment_col)
-                
-                # Default formatting for all comment cells
-                comment_cell.alignment = Alignment(wrap_text=True, vertical='center')
-                comment_cell.border = Border(
-                    left=Side(style='thin'),
-                    right=Side(style='thin'),
-                    top=Side(style='thin'),
-                    bottom=Side(style='thin')
-                )
+            texts = _comment_texts(comment_codes)
+            
+            if DIRECT_CELL_STORE and hasattr(sheet, '_cells'):
+                # The comment column is overwritten wholesale, so build the cells
+                # and insert them in one update rather than going through sheet.cell
+                row_cells = [
+                    Cell(sheet, row=row, column=comment_col, value=text)
+                    for row, text in zip(rows, texts)
+                ]
+                self._apply_comment_styles(row_cells, comment_codes)
+                sheet._cells.update(((row, comment_col), comment_cell) for row, comment_cell in zip(rows, row_cells))
+            else:
+                # Bind loop-invariant names locally
+                cell = sheet.cell
                 
-                # Clear any existing fills or values
-                comment_cell.value = None
-                comment_cell.fill = PatternFill(fill_type=None)
+                row_cells = []
+                for row, text in zip(rows, texts):
+                    comment_cell = cell(row, comment_col)
+                    comment_cell.value = text
+                    row_cells.append(comment_cell)
                 
-                # Apply business rules to determine comments
-                if difference_value != 0:  # Only process rows with differences
-                    if include_cfo_value in ("N", "NO") and explanation_value not in (None, "", 0):
-                        comment_cell.value = "Explanation Reasonable"
-                        explanation_reasonable_count += 1
-                        processed_count += 1
-                    elif include_cfo_value in ("Y", "YES") and explanation_value not in (None, "", 0):
-                        comment_cell.value = "Explanation Reasonable; Include in CFO Cert Letter"
-                        include_in_cfo_count += 1
-                        processed_count += 1    
-                    elif explanation_value in (None, "", 0):
-                        comment_cell.value = "Explanation Required"
-                        # Add highlighting for cells that require attention - explicit color values
-                        comment_cell.fill = PatternFill(start_color="FFCCCC", end_color="FFCCCC", fill_type="solid")
-                        explanation_required_count += 1
-                        processed_count += 1
-                        
-            except Exception as e:
-                self.logger.warning(f"Error processing row {row}: {str(e)}")
+                self._apply_comment_styles(row_cells, comment_codes)
+        except Exception as e:
+            # The comments are written in bulk, so the failure is reported for the rows being processed
+            self.logger.error(
+                f"Error processing DO Comments on sheet '{sheet.title}' (rows {header_row + 1} to {matching_row - 1}): {e}",
+                exc_info=True
+            )
+            self._update_status(f"DO Comments processing stopped on sheet '{sheet.title}': {e}")
+            return
         
-        self.logger.info(f"DO Comments summary: {explanation_reasonable_count} Explanation Reasonable, "
-                         f"{include_in_cfo_count} Include in CFO, {explanation_required_count} Explanation Required")
-        self._update_status(f"Successfully processed {processed_count} rows with DO Comments")
+        self._report_do_comments(comment_codes)
     
-    def _validate_file(self, file_path: str) -> None:
+    def _validate_file(self, file_path: str) -> int:
         """
         Validate the input file path.
         
         Args:
             file_path: Path to Excel file
         
+        Returns:
+            int: File size in bytes
+        
         Raises:
             ValueError: If file validation fails
         """
-        if not os.path.exists(file_path):
-            raise ValueError(f"File does not exist: {file_path}")
+        try:
+            file_size = os.stat(file_path).st_size
+        except FileNotFoundError:
+            raise ValueError(f"File does not exist: {file_path}") from None
         if not file_path.lower().endswith('.xlsx'):
             raise ValueError("File must be an Excel (.xlsx) file")
+        if file_size == 0:
+            raise ValueError(f"File is empty: {file_path}")
+        return file_size
     
     def _generate_new_filename(self, original_file: str) -> str:
         """
@@ -2157,16 +3548,27 @@ class ExcelProcessor:
         # Get original file basename without extension
         original_basename = Path(original_file).stem
         
-        # Create output directory if it doesn't exist
+        # Create output directory if it doesn't exist, once per configured directory
         output_dir = Path(self.output_directory)
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Create a descriptive filename with timestamp
+        if self._created_output_dir != self.output_directory:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._created_output_dir = self.output_directory
+        
+        # Create a descriptive filename with timestamp; a counter is added for
+        # names this processor already used in the same second and for files
+        # already on disk. The name is not reserved, so two processes can still
+        # pick it at once - process_files never runs two inputs with the same
+        # name concurrently for that reason
         timestamp = time.strftime("%Y%m%d-%H%M%S")
-        new_filename = f"{original_basename}_processed_{timestamp}.xlsx"
-        
-        # Construct full path
-        new_path = output_dir / new_filename
+        last_timestamp, count = self._filename_stamp
+        count = count + 1 if timestamp == last_timestamp else 0
+        while True:
+            suffix = f"-{count}" if count else ""
+            new_path = output_dir / f"{original_basename}_processed_{timestamp}{suffix}.xlsx"
+            if not new_path.exists():
+                break
+            count += 1
+        self._filename_stamp = (timestamp, count)
         
         self._update_status(f"Generated output filename: {new_path}")
         return str(new_path.absolute())
@@ -2175,12 +3577,21 @@ class ExcelProcessor:
         """
         Generate a temporary file path.
         
+        While process_file is running the path is inside its temp directory,
+        which is removed as a whole when processing ends. The file is created
+        empty so that the name is reserved.
+        
         Args:
             prefix: Prefix for temporary file
             
         Returns:
             str: Temporary file path
         """
+        if self._temp_dir is not None:
+            with tempfile.NamedTemporaryFile(prefix=f"{prefix}_", suffix=".xlsx", dir=self._temp_dir.name,
+                                             delete=False) as temp_handle:
+                return temp_handle.name
+        
         # Try to get temp directory from configuration
         try:
             from ..modules.file_operations import get_temp_file_path
@@ -2189,8 +3600,7 @@ class ExcelProcessor:
             return temp_file
         except ImportError:
             # Fallback to local implementation if module is not available
-            temp_dir = tempfile.gettempdir()
-            unique_id = str(uuid.uuid4())
-            temp_file = os.path.join(temp_dir, f"{prefix}_temp_{unique_id}.xlsx")
+            with tempfile.NamedTemporaryFile(prefix=f"{prefix}_temp_", suffix=".xlsx", delete=False) as temp_handle:
+                temp_file = temp_handle.name
             self._temp_files.append(temp_file)  # Track for cleanup
             return temp_file
\ No newline at end of file
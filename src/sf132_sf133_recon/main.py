@@ -8,6 +8,7 @@ SF132 to SF133 reconciliation Excel files.
 import sys
 import os
 import logging
+import multiprocessing
 import threading
 import argparse
 import time
@@ -408,4 +409,5 @@ def main() -> int:
         return 1
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,181 @@
+"""
+Unit tests for the DO Comments row classification.
+"""
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Add parent directory to path to allow imports
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from src.sf132_sf133_recon.core import excel_processor
+from src.sf132_sf133_recon.core.excel_processor import (
+    COMMENT_NONE,
+    COMMENT_REASONABLE,
+    COMMENT_INCLUDE_CFO,
+    COMMENT_REQUIRED,
+    DO_COMMENT_TEXT,
+)
+
+# (difference, include_cfo, explanation, expected code)
+CASES = [
+    (None, "N", "ok", COMMENT_NONE),
+    ("", "Y", None, COMMENT_NONE),
+    (0, "N", None, COMMENT_NONE),
+    (0.0, "Y", "ok", COMMENT_NONE),
+    ("abc", "N", None, COMMENT_NONE),
+    (12.5, "N", "ok", COMMENT_REASONABLE),
+    (-3, "no", "because", COMMENT_REASONABLE),
+    ("7", "Y", "ok", COMMENT_INCLUDE_CFO),
+    (1, "Yes", "ok", COMMENT_INCLUDE_CFO),
+    (1, "N", None, COMMENT_REQUIRED),
+    (1, "Y", "", COMMENT_REQUIRED),
+    (1, None, 0, COMMENT_REQUIRED),
+    (1, "maybe", False, COMMENT_REQUIRED),
+    (1, "maybe", "ok", COMMENT_NONE),
+    (1, None, "ok", COMMENT_NONE),
+]
+
+
+class TestDoCommentClassification(unittest.TestCase):
+    """Test cases for DO Comments classification."""
+
+    def test_single_row_classifier(self):
+        """Test the per-row classifier against the business rules."""
+        for diff, cfo, expl, expected in CASES:
+            with self.subTest(diff=diff, cfo=cfo, expl=expl):
+                self.assertEqual(excel_processor._classify_do_comment(diff, cfo, expl), expected)
+
+    def test_vectorized_classifier_matches_rules(self):
+        """Test that the batch classifier agrees with the per-row rules."""
+        differences, cfo_values, explanations, expected = zip(*CASES)
+        codes, invalid_rows = excel_processor._classify_do_comments(differences, cfo_values, explanations)
+        self.assertEqual([int(code) for code in codes], list(expected))
+        self.assertEqual(list(invalid_rows), [4])
+
+    def test_kernel_matches_lookup_table(self):
+        """Test that the Numba kernel, run uncompiled, agrees with the lookup table."""
+        import numpy as np
+        cfo_codes, has_explanation, diff_zero = (
+            axis.ravel() for axis in np.meshgrid([0, 1, 2], [False, True], [False, True], indexing="ij")
+        )
+        out_codes = np.empty(cfo_codes.size, dtype=np.int8)
+        excel_processor._classify_codes_kernel(cfo_codes, has_explanation, diff_zero, out_codes)
+        expected = excel_processor._COMMENT_LUT[cfo_codes, has_explanation.astype(np.int8), diff_zero.astype(np.int8)]
+        self.assertEqual(out_codes.tolist(), expected.tolist())
+
+    def test_uniform_cfo_flag(self):
+        """Test that a sheet-wide CFO flag gives the same codes as mixed flags."""
+        for flag in ("N", "yes", None):
+            cases = [(diff, flag, expl) for diff, _, expl, _ in CASES]
+            expected = [excel_processor._classify_do_comment(*case) for case in cases]
+            with self.subTest(flag=flag):
+                codes, _ = excel_processor._classify_do_comments(*zip(*cases))
+                self.assertEqual([int(code) for code in codes], expected)
+
+    def test_nan_difference(self):
+        """Test that a NaN difference is treated as non-numeric by both classifiers."""
+        nan = float("nan")
+        self.assertEqual(excel_processor._classify_do_comment(nan, "N", None), COMMENT_NONE)
+        codes, invalid_rows = excel_processor._classify_do_comments([nan, 1], ["N", "N"], [None, None])
+        self.assertEqual([int(code) for code in codes], [COMMENT_NONE, COMMENT_REQUIRED])
+        self.assertEqual(list(invalid_rows), [0])
+
+    def test_no_differences(self):
+        """Test that a sheet with no differences gets no comments."""
+        codes, invalid_rows = excel_processor._classify_do_comments([None, 0, ""], ["Y", "N", None], [None, "ok", 0])
+        self.assertEqual([int(code) for code in codes], [COMMENT_NONE] * 3)
+        self.assertEqual(len(invalid_rows), 0)
+
+    def test_empty_input(self):
+        """Test that classifying no rows returns no codes."""
+        codes, invalid_rows = excel_processor._classify_do_comments([], [], [])
+        self.assertEqual(len(codes), 0)
+        self.assertEqual(len(invalid_rows), 0)
+
+    def test_parallel_classifier_matches_serial(self):
+        """Test that chunked classification keeps row order and invalid offsets."""
+        differences, cfo_values, explanations, expected = zip(*(CASES * 3))
+        with mock.patch.object(excel_processor, "PARALLEL_CLASSIFY_ROW_THRESHOLD", 0):
+            codes, invalid_rows = excel_processor._classify_do_comments_parallel(
+                differences, cfo_values, explanations, processes=2
+            )
+        self.assertEqual([int(code) for code in codes], list(expected))
+        self.assertEqual(list(invalid_rows), [4, 19, 34])
+
+        # A shared pool gives the same result across calls
+        with mock.patch.object(excel_processor, "PARALLEL_CLASSIFY_ROW_THRESHOLD", 0):
+            pool = excel_processor._classify_pool(len(differences), processes=2)
+            self.assertIsNotNone(pool)
+            try:
+                for _ in range(2):
+                    codes, invalid_rows = excel_processor._classify_do_comments_parallel(
+                        differences, cfo_values, explanations, processes=2, pool=pool
+                    )
+                    self.assertEqual([int(code) for code in codes], list(expected))
+                    self.assertEqual(list(invalid_rows), [4, 19, 34])
+            finally:
+                pool.close()
+                pool.join()
+
+    def test_contiguous_runs(self):
+        """Test grouping highlighted rows into runs."""
+        self.assertEqual(excel_processor._contiguous_runs([]), [])
+        self.assertEqual(excel_processor._contiguous_runs([2, 3, 4, 7, 9, 10]), [(2, 4), (7, 7), (9, 10)])
+
+    def test_column_chunks(self):
+        """Test reading selected columns in chunks of rows."""
+        import openpyxl
+        sheet = openpyxl.Workbook().active
+        for row in range(1, 8):
+            sheet.append([row, f"b{row}", None, row * 10])
+        chunks = list(excel_processor._iter_column_chunks(sheet, 2, 6, (4, 1), chunk_rows=2))
+        self.assertEqual(chunks, [([20, 30], [2, 3]), ([40, 50], [4, 5]), ([60], [6])])
+        list(excel_processor._iter_column_chunks(sheet, 1, 20, (3, 9)))
+        self.assertEqual(sheet.max_row, 7)
+        self.assertEqual(sheet.max_column, 4)
+
+    def test_streamed_rows_match_separate_passes(self):
+        """Test that classifying while streaming rows finds the same rows and codes."""
+        import openpyxl
+        from openpyxl.styles import PatternFill
+        blue = PatternFill("solid", start_color="FF4472C4")
+        sheet = openpyxl.Workbook().active
+        sheet.append(["Title"])
+        for _ in range(3):
+            sheet.append([])
+        sheet.append(["TAS", "Difference", "Include in CFO Cert Letter", "Explanation"])
+        for offset, (diff, cfo, expl, _) in enumerate(CASES):
+            sheet.append([f"TAS{offset}", diff, cfo, expl])
+        sheet.append(["Total"])
+        sheet.append(["note"])
+        sheet["A5"].fill = blue
+        sheet.cell(row=6 + len(CASES), column=1).fill = blue
+
+        processor = excel_processor.ExcelProcessor()
+        column_indexes = processor._find_column_indexes(sheet)
+        rgb_color = processor._process_header_formatting(sheet)
+        matching_row = processor._find_matching_row(sheet, rgb_color)
+        rows, expected = processor._classify_sheet_rows(sheet, column_indexes, matching_row)
+        expected_codes = dict(zip(rows, (int(code) for code in expected)))
+
+        with mock.patch.object(excel_processor, "STREAM_CLASSIFY_ROWS", 4):
+            streamed = list(processor._iter_classified_rows(sheet, column_indexes, rgb_color, sheet.max_column))
+        self.assertEqual([row_idx for row_idx, _, _ in streamed], list(range(1, sheet.max_row + 1)))
+        self.assertEqual({row_idx: code for row_idx, _, code in streamed if code is not None}, expected_codes)
+        self.assertEqual(len(expected_codes), len(CASES))
+
+    def test_comment_text(self):
+        """Test the comment text mapping."""
+        self.assertIsNone(DO_COMMENT_TEXT[COMMENT_NONE])
+        self.assertEqual(DO_COMMENT_TEXT[COMMENT_REQUIRED], "Explanation Required")
+        self.assertEqual(
+            excel_processor._comment_texts([COMMENT_REQUIRED, COMMENT_NONE]),
+            ["Explanation Required", None]
+        )
+
+if __name__ == '__main__':
+    unittest.main()
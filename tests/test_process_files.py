@@ -0,0 +1,119 @@
+"""
+Unit tests for processing several workbooks in worker processes.
+"""
+import os
+import sys
+import tempfile
+import unittest
+from queue import Queue
+
+# Add parent directory to path to allow imports
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from src.sf132_sf133_recon.core import excel_processor
+
+
+def _build_workbook(path):
+    """Write a small SF132/SF133 sheet with the header on row 5 and a total row."""
+    import openpyxl
+    from openpyxl.styles import PatternFill
+    blue = PatternFill("solid", start_color="FF4472C4")
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = excel_processor.DEFAULT_SHEET_NAME
+    sheet.append(["SF132 to SF133"])
+    for _ in range(3):
+        sheet.append([])
+    sheet.append(["TAS", "Difference", "Include in CFO Cert Letter", "Explanation"])
+    sheet.append(["TAS1", 12.5, "N", "ok"])
+    sheet.append(["TAS2", 1, "Y", None])
+    sheet.append(["Total"])
+    sheet["A5"].fill = blue
+    sheet["A8"].fill = blue
+    workbook.save(path)
+
+
+class TestProcessFiles(unittest.TestCase):
+    """Test cases for ExcelProcessor.process_files."""
+
+    def test_outputs_are_distinct(self):
+        """Test that every input, including a repeated name, gets its own output file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_paths = []
+            for folder, name in (("a", "report"), ("a", "other"), ("b", "report")):
+                os.makedirs(os.path.join(temp_dir, folder), exist_ok=True)
+                file_paths.append(os.path.join(temp_dir, folder, f"{name}.xlsx"))
+                _build_workbook(file_paths[-1])
+
+            queue = Queue()
+            processor = excel_processor.ExcelProcessor(queue)
+            processor.output_directory = os.path.join(temp_dir, "output")
+            outputs = processor.process_files(file_paths, max_workers=2)
+
+            self.assertEqual(len(outputs), len(file_paths))
+            self.assertNotIn(None, outputs)
+            self.assertEqual(len(set(outputs)), len(outputs))
+            for output_file, file_path in zip(outputs, file_paths):
+                self.assertTrue(os.path.isfile(output_file))
+                self.assertTrue(os.path.basename(output_file).startswith(
+                    f"{os.path.splitext(os.path.basename(file_path))[0]}_processed_"))
+
+            results = []
+            while not queue.empty():
+                message = queue.get_nowait()
+                if message[0] in ("success", "warning", "error"):
+                    results.append(message[0])
+            self.assertEqual(results, ["success"] * len(file_paths))
+
+    def test_output_check_requires_processed_sheet(self):
+        """Test that the default output check rejects a workbook without the DO Comments header."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "report.xlsx")
+            _build_workbook(file_path)
+            processor = excel_processor.ExcelProcessor()
+            self.assertFalse(processor._check_output_file(file_path))
+
+            processor.output_directory = os.path.join(temp_dir, "output")
+            self.assertTrue(processor.process_file(file_path))
+            self.assertTrue(processor._check_output_file(processor.last_output_file))
+
+    @unittest.skipUnless(excel_processor.XLSXWRITER_AVAILABLE, "xlsxwriter is not installed")
+    def test_writers_match(self):
+        """Test that the xlsxwriter and openpyxl writers give the same widths and number formats."""
+        import openpyxl
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "report.xlsx")
+            _build_workbook(file_path)
+            workbook = openpyxl.load_workbook(file_path)
+            sheet = workbook.active
+            sheet.column_dimensions["A"].width = 10.7109375
+            sheet.column_dimensions["B"].width = 20
+            sheet["B6"].number_format = "#,##0.00"
+            workbook.save(file_path)
+
+            outputs = []
+            for fast_writer in (False, True):
+                processor = excel_processor.ExcelProcessor()
+                processor.fast_writer = fast_writer
+                processor.output_directory = os.path.join(temp_dir, f"output{int(fast_writer)}")
+                self.assertTrue(processor.process_file(file_path))
+                output = openpyxl.load_workbook(processor.last_output_file).active
+                # xlsxwriter stores neighbouring columns of the same width as one range
+                widths = {}
+                for dim in output.column_dimensions.values():
+                    for col_idx in range(dim.min, dim.max + 1):
+                        widths[col_idx] = dim.width
+                number_formats = {
+                    cell.coordinate: cell.number_format
+                    for row in output.iter_rows() for cell in row if cell.number_format != "General"
+                }
+                outputs.append((widths, number_formats))
+            self.assertEqual(outputs[0], outputs[1])
+            self.assertEqual(outputs[0][0][1], 10.7109375)
+            self.assertEqual(outputs[0][1], {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+Unit tests for the rate-limited progress updates.
+"""
+import os
+import sys
+import unittest
+from queue import Queue
+from unittest import mock
+
+# Add parent directory to path to allow imports
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from src.sf132_sf133_recon.core import excel_processor
+
+
+def _drain(queue):
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+class TestProgressThrottle(unittest.TestCase):
+    """Test cases for ExcelProcessor._update_progress."""
+
+    def setUp(self):
+        self.queue = Queue()
+        self.processor = excel_processor.ExcelProcessor(self.queue)
+        self.clock = mock.patch.object(excel_processor.time, "monotonic", return_value=100.0)
+        self.clock.start()
+        self.addCleanup(self.clock.stop)
+
+    def test_close_updates_are_held_back_and_flushed(self):
+        """Test that a held-back update is queued ahead of the next one sent."""
+        with self.assertLogs(excel_processor.__name__, level="INFO") as logs:
+            self.processor._update_progress(10, "Reading")
+            self.processor._update_progress(11, "Still reading")
+            self.processor._update_progress(11.5, "Almost read")
+        self.assertEqual(_drain(self.queue), [("progress", (10, "Reading"))])
+        self.assertEqual(len([line for line in logs.output if "read" in line.lower()]), 3)
+
+        self.processor._update_progress(20, "Writing")
+        self.assertEqual(_drain(self.queue), [
+            ("progress", (11.5, "Almost read")),
+            ("progress", (20, "Writing")),
+        ])
+
+    def test_status_flushes_held_back_progress(self):
+        """Test that a status message first sends the held-back progress."""
+        self.processor._update_progress(10, "Reading")
+        self.processor._update_progress(11, "Still reading")
+        self.processor._update_status("Saving")
+        self.assertEqual(_drain(self.queue), [
+            ("progress", (10, "Reading")),
+            ("progress", (11, "Still reading")),
+            ("status", "Saving"),
+        ])
+
+    def test_completion_and_elapsed_updates_are_sent(self):
+        """Test that completion, and updates after the interval, are never held back."""
+        self.processor._update_progress(10, "Reading")
+        self.processor._update_progress(100, "Done")
+        excel_processor.time.monotonic.return_value += excel_processor.PROGRESS_MIN_INTERVAL
+        self.processor._update_progress(0, "Next file")
+        self.assertEqual([value for _, (value, _) in _drain(self.queue)], [10, 100, 0])
+
+if __name__ == '__main__':
+    unittest.main()